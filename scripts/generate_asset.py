@@ -18,30 +18,57 @@ import os
 import sys
 import time
 from pathlib import Path
+from typing import Callable
 
 import httpx
-from dotenv import load_dotenv
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-from src.config import get_default_provider, get_image_model
+# Gemini has no request timeout by default; cap it like the HTTP providers
+GEMINI_TIMEOUT_MS = 240_000
 
-# Load environment variables
-load_dotenv()
+# Overall cap on one generation, Kie polling included; every request's
+# timeout is clipped to the time left
+DEFAULT_TIMEOUT_SECONDS = 300
 
+KIE_POLL_SECONDS = 5
 
-def generate_dalle(prompt: str, output_path: str, size: str = "1024x1792") -> bool:
+
+class AssetGenerationError(Exception):
+    """A provider rejected or failed an image request (message is user-facing)."""
+
+
+class AssetTimeoutError(AssetGenerationError):
+    """The provider did not deliver an image before the deadline."""
+
+
+def _time_left(deadline: float, cap: float) -> float:
+    """Seconds a request may take: `cap`, clipped to the deadline."""
+    left = deadline - time.monotonic()
+    if left <= 0:
+        raise AssetTimeoutError("Deadline reached before the image was ready")
+    return min(cap, left)
+
+
+def generate_dalle(
+    prompt: str,
+    output_path: str,
+    size: str = "1024x1792",
+    log: Callable[[str], None] = print,
+    timeout: float = DEFAULT_TIMEOUT_SECONDS,
+) -> None:
     """Generate image using OpenAI DALL-E 3."""
+    from src.config import get_image_model
+
+    deadline = time.monotonic() + timeout
+
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
-        print("[ERROR] OPENAI_API_KEY not set", file=sys.stderr)
-        return False
+        raise AssetGenerationError("OPENAI_API_KEY not set")
 
     try:
         model_name = get_image_model("openai")
         
-        print(f"   [OpenAI] Model: {model_name}")
-        print(f"   Prompt: {prompt[:100]}...")
+        log(f"   [OpenAI] Model: {model_name}")
+        log(f"   Prompt: {prompt[:100]}...")
 
         # Truncate if too long
         if len(prompt) > 4000:
@@ -61,7 +88,7 @@ def generate_dalle(prompt: str, output_path: str, size: str = "1024x1792") -> bo
                 "quality": "hd",
                 "response_format": "b64_json",
             },
-            timeout=120.0,
+            timeout=_time_left(deadline, 120.0),
         )
         response.raise_for_status()
 
@@ -72,24 +99,39 @@ def generate_dalle(prompt: str, output_path: str, size: str = "1024x1792") -> bo
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
         Path(output_path).write_bytes(image_bytes)
 
-        print(f"[OK] Image saved: {output_path}")
-        return True
+        log(f"[OK] Image saved: {output_path}")
 
     except httpx.HTTPStatusError as e:
-        print(f"[ERROR] OpenAI API error: {e.response.status_code}", file=sys.stderr)
-        print(f"   {e.response.text[:200]}", file=sys.stderr)
-        return False
+        raise AssetGenerationError(
+            f"OpenAI API error: {e.response.status_code}\n   {e.response.text[:200]}"
+        ) from e
+    except httpx.TimeoutException as e:
+        raise AssetTimeoutError(f"OpenAI request timed out: {e}") from e
+    except AssetGenerationError:
+        raise
     except Exception as e:
-        print(f"[ERROR] {e}", file=sys.stderr)
-        return False
+        raise AssetGenerationError(str(e)) from e
+
 
+def generate_kie(
+    prompt: str,
+    output_path: str,
+    log: Callable[[str], None] = print,
+    tick: Callable[[str], None] | None = None,
+    timeout: float = DEFAULT_TIMEOUT_SECONDS,
+) -> None:
+    """Generate image using Kie.ai Nano Banana Pro API.
 
-def generate_kie(prompt: str, output_path: str) -> bool:
-    """Generate image using Kie.ai Nano Banana Pro API."""
+    Poll progress lines go to `tick` (default: `log`). The task is polled
+    until it finishes or `timeout` seconds have passed since the call.
+    """
+    from src.config import get_image_model
+
+    deadline = time.monotonic() + timeout
+    tick = tick or log
     api_key = os.getenv("KIE_API_KEY")
     if not api_key:
-        print("[ERROR] KIE_API_KEY not set", file=sys.stderr)
-        return False
+        raise AssetGenerationError("KIE_API_KEY not set")
     
     # Strip any smart quotes or whitespace from API key
     api_key = api_key.strip().strip('"').strip('"').strip('"').strip("'").strip("'")
@@ -100,8 +142,8 @@ def generate_kie(prompt: str, output_path: str) -> bool:
         prompt = prompt.replace('—', '-').replace('–', '-').replace('…', '...')
         
         model_name = get_image_model("kie")
-        print(f"   [Kie.ai] Model: {model_name}")
-        print(f"   Prompt: {prompt[:100]}...")
+        log(f"   [Kie.ai] Model: {model_name}")
+        log(f"   Prompt: {prompt[:100]}...")
 
         # Step 1: Create task
         response = httpx.post(
@@ -119,40 +161,39 @@ def generate_kie(prompt: str, output_path: str) -> bool:
                     "output_format": "png"
                 }
             },
-            timeout=60.0,
+            timeout=_time_left(deadline, 60.0),
         )
         response.raise_for_status()
 
         data = response.json()
         
         if data.get("code") != 200:
-            print(f"[ERROR] Task creation failed: {data.get('msg')}", file=sys.stderr)
-            return False
+            raise AssetGenerationError(f"Task creation failed: {data.get('msg')}")
         
         task_id = data.get("data", {}).get("taskId")
         if not task_id:
-            print("[ERROR] No taskId in response", file=sys.stderr)
-            return False
+            raise AssetGenerationError("No taskId in response")
         
-        print(f"   Task created: {task_id}")
+        log(f"   Task created: {task_id}")
         
-        # Step 2: Poll for result
-        max_attempts = 60  # 5 minutes max
-        for attempt in range(max_attempts):
-            time.sleep(5)
+        # Step 2: Poll for result until the deadline
+        attempt = 0
+        while True:
+            time.sleep(_time_left(deadline, KIE_POLL_SECONDS))
+            attempt += 1
             
             status_response = httpx.get(
                 "https://api.kie.ai/api/v1/jobs/recordInfo",
                 headers={"Authorization": f"Bearer {api_key}"},
                 params={"taskId": task_id},
-                timeout=30.0,
+                timeout=_time_left(deadline, 30.0),
             )
             
             status_response.raise_for_status()
             status_data = status_response.json()
             
             if status_data.get("code") != 200:
-                print(f"   Waiting... ({attempt + 1}/{max_attempts})")
+                tick(f"   Waiting... (poll {attempt})")
                 continue
             
             task_info = status_data.get("data", {})
@@ -165,57 +206,63 @@ def generate_kie(prompt: str, output_path: str) -> bool:
                     result_urls = result_data.get("resultUrls", [])
                     if result_urls:
                         image_url = result_urls[0]
-                        img_response = httpx.get(image_url, timeout=60.0)
+                        img_response = httpx.get(
+                            image_url, timeout=_time_left(deadline, 60.0)
+                        )
                         img_response.raise_for_status()
                         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
                         Path(output_path).write_bytes(img_response.content)
-                        print(f"[OK] Image saved: {output_path}")
-                        return True
+                        log(f"[OK] Image saved: {output_path}")
+                        return
                     else:
-                        print(f"[ERROR] No resultUrls in resultJson", file=sys.stderr)
-                        return False
+                        raise AssetGenerationError(f"No resultUrls in resultJson")
                 except json.JSONDecodeError as e:
-                    print(f"[ERROR] Failed to parse resultJson: {e}", file=sys.stderr)
-                    return False
+                    raise AssetGenerationError(f"Failed to parse resultJson: {e}")
             
             elif state == "fail":
                 fail_msg = task_info.get("failMsg", "Unknown error")
-                print(f"[ERROR] Task failed: {fail_msg}", file=sys.stderr)
-                return False
+                raise AssetGenerationError(f"Task failed: {fail_msg}")
             
             else:
-                print(f"   Waiting... ({attempt + 1}/{max_attempts}) state: {state}")
-        
-        print("[ERROR] Task timed out", file=sys.stderr)
-        return False
+                tick(f"   Waiting... (poll {attempt}) state: {state}")
 
     except httpx.HTTPStatusError as e:
-        print(f"[ERROR] Kie.ai API error: {e.response.status_code}", file=sys.stderr)
-        print(f"   {e.response.text[:500]}", file=sys.stderr)
-        return False
+        raise AssetGenerationError(
+            f"Kie.ai API error: {e.response.status_code}\n   {e.response.text[:500]}"
+        ) from e
+    except httpx.TimeoutException as e:
+        raise AssetTimeoutError(f"Kie.ai request timed out: {e}") from e
+    except AssetGenerationError:
+        raise
     except Exception as e:
-        print(f"[ERROR] Kie.ai error: {e}", file=sys.stderr)
-        import traceback
-        traceback.print_exc()
-        return False
+        raise AssetGenerationError(f"Kie.ai error: {e}") from e
 
 
-def generate_gemini(prompt: str, output_path: str) -> bool:
+def generate_gemini(
+    prompt: str,
+    output_path: str,
+    log: Callable[[str], None] = print,
+    timeout: float = DEFAULT_TIMEOUT_SECONDS,
+) -> None:
     """Generate image using Google Gemini."""
+    from src.config import get_image_model
+
     api_key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
     if not api_key:
-        print("[ERROR] GEMINI_API_KEY or GOOGLE_API_KEY not set", file=sys.stderr)
-        return False
+        raise AssetGenerationError("GEMINI_API_KEY or GOOGLE_API_KEY not set")
 
     try:
         from google import genai
         from google.genai import types
         
-        client = genai.Client(api_key=api_key)
+        client = genai.Client(
+            api_key=api_key,
+            http_options=types.HttpOptions(timeout=min(GEMINI_TIMEOUT_MS, int(timeout * 1000))),
+        )
         model_name = get_image_model("gemini")
 
-        print(f"   [Gemini] Model: {model_name}")
-        print(f"   Prompt: {prompt[:100]}...")
+        log(f"   [Gemini] Model: {model_name}")
+        log(f"   Prompt: {prompt[:100]}...")
 
         response = client.models.generate_content(
             model=model_name,
@@ -235,18 +282,51 @@ def generate_gemini(prompt: str, output_path: str) -> bool:
                     Path(output_path).parent.mkdir(parents=True, exist_ok=True)
                     Path(output_path).write_bytes(image_bytes)
                     
-                    print(f"[OK] Image saved: {output_path}")
-                    return True
+                    log(f"[OK] Image saved: {output_path}")
+                    return
 
-        print("[ERROR] No image in response", file=sys.stderr)
-        return False
+        raise AssetGenerationError("No image in response")
 
+    except httpx.TimeoutException as e:
+        raise AssetTimeoutError(f"Gemini request timed out: {e}") from e
+    except AssetGenerationError:
+        raise
     except Exception as e:
-        print(f"[ERROR] Gemini error: {e}", file=sys.stderr)
-        return False
+        raise AssetGenerationError(f"Gemini error: {e}") from e
+
+
+def generate_asset(
+    prompt: str,
+    output_path: str,
+    provider: str,
+    size: str = "1024x1792",
+    log: Callable[[str], None] = print,
+    tick: Callable[[str], None] | None = None,
+    timeout: float = DEFAULT_TIMEOUT_SECONDS,
+) -> None:
+    """Generate one image with the given provider (library entry point).
+
+    Progress lines go to `log`, repeated poll ticks to `tick` (default:
+    `log`). Raises AssetGenerationError with the provider's message on
+    failure, or its subclass AssetTimeoutError when the provider has not
+    delivered within `timeout` seconds.
+    """
+    if provider == "openai":
+        generate_dalle(prompt, output_path, size, log=log, timeout=timeout)
+    elif provider == "kie":
+        generate_kie(prompt, output_path, log=log, tick=tick, timeout=timeout)
+    else:
+        generate_gemini(prompt, output_path, log=log, timeout=timeout)
 
 
 def main():
+    # Standalone use: make `src` importable and load .env (library callers do both)
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    from src.config import get_default_provider
+
     parser = argparse.ArgumentParser(description="Arcanomy Motion Asset Generator")
     
     parser.add_argument("--prompt", required=True, help="Image generation prompt")
@@ -268,12 +348,12 @@ def main():
     print(f"Provider: {args.provider}")
     print(f"{'='*60}\n")
 
-    if args.provider == "openai":
-        success = generate_dalle(args.prompt, args.output, args.size)
-    elif args.provider == "kie":
-        success = generate_kie(args.prompt, args.output)
-    else:
-        success = generate_gemini(args.prompt, args.output)
+    try:
+        generate_asset(args.prompt, args.output, args.provider, args.size)
+        success = True
+    except AssetGenerationError as e:
+        print(f"[ERROR] {e}", file=sys.stderr)
+        success = False
 
     print(f"\n{'='*60}\n")
     sys.exit(0 if success else 1)
@@ -1,8 +1,12 @@
 """CLI commands for Arcanomy Motion - CapCut Kit Pipeline."""
 
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 import json
+import os
+import subprocess
+import sys
 
 import typer
 
@@ -11,31 +15,94 @@ from src.utils.paths import (
     inputs_dir,
     seed_path,
 )
-from src.pipeline import (
-    init as pipeline_init,
-    generate_plan,
-    generate_subsegments,
-    generate_voice,
-    generate_captions_srt,
-    render_charts,
-    generate_kit,
-)
-from src.pipeline.visual_plan import generate_visual_plan
-from src.pipeline.assets import generate_assets
-from src.pipeline.vidprompt import generate_video_prompts
-from src.pipeline.videos import generate_videos
-from src.services import LLMService
-from src.utils.logger import get_logger
+
+# Pipeline stages pull in LLM SDKs, httpx and pydantic. They are imported inside
+# the commands that run them so `set`, `current`, `status`, etc. start fast.
 
 app = typer.Typer(
     name="arcanomy",
     help="Arcanomy Motion - CapCut kit pipeline for short-form video production",
 )
 
-logger = get_logger()
-
 # File to store current reel context
 CURRENT_REEL_FILE = Path(".current_reel")
+# Optional per-shell override, set via `eval "$(uv run set <reel> --export)"`
+CURRENT_REEL_ENV = "ARCANOMY_CURRENT_REEL"
+
+# Reel files that mark stage progress, with their label in `status` and in the
+# shorter `current` summary (None = not shown there). Paths are relative to the reel.
+STAGE_FILES = (
+    ("inputs/claim.json", "Claim (input)", "Claim"),
+    ("inputs/chart.json", "Chart (optional)", None),
+    ("meta/provenance.json", "Provenance", "Init"),
+    ("meta/plan.json", "Plan", "Plan"),
+    ("meta/visual_plan.json", "Visual Plan", "Visual Plan"),
+    ("renders/images/composites", "Assets (images)", "Assets"),
+    ("meta/video_prompts.json", "Video Prompts", "Vidprompt"),
+    ("renders/videos", "Videos", "Videos"),
+    ("subsegments/subseg-01.mp4", "Subsegments", "Subsegments"),
+    ("voice/subseg-01.wav", "Voice", "Voice"),
+    ("captions/captions.srt", "Captions", "Captions"),
+    ("charts", None, "Charts"),
+    ("thumbnail/thumbnail.png", "Thumbnail", "Thumbnail"),
+    ("guides/capcut_assembly_guide.md", "CapCut Guide", None),
+    ("guides/retention_checklist.md", "Retention Checklist", None),
+    ("meta/quality_gate.json", "Quality Gate", "Quality Gate"),
+)
+STATUS_FILES = tuple((path, label) for path, label, _ in STAGE_FILES if label)
+CURRENT_STATUS_FILES = tuple((path, label) for path, _, label in STAGE_FILES if label)
+
+
+@lru_cache(maxsize=1)
+def _read_current_reel(mtime_ns: int, size: int) -> Path:
+    """Read .current_reel. Cached on its (mtime, size) so repeated lookups skip the read.
+
+    The size guards against filesystems with coarse mtimes, where another
+    process can rewrite the file within the same timestamp tick.
+    """
+    return Path(CURRENT_REEL_FILE.read_bytes().decode("utf-8").strip())
+
+
+def _current_reel_path() -> Path | None:
+    """Path stored in .current_reel, or None if no reel is set.
+
+    $ARCANOMY_CURRENT_REEL wins when it names an existing folder, which skips
+    the file read. Otherwise the file's path itself is not checked; see
+    _get_current_reel for that.
+    """
+    env_path = os.environ.get(CURRENT_REEL_ENV)
+    if env_path and os.path.isdir(env_path):
+        return Path(env_path)
+    try:
+        st = os.stat(CURRENT_REEL_FILE)
+    except FileNotFoundError:
+        return None
+    return _read_current_reel(st.st_mtime_ns, st.st_size)
+
+
+def _set_current_reel(reel_path: Path, *, warn_override: bool = True) -> Path:
+    """Point .current_reel at `reel_path`. Returns the resolved path written.
+
+    Warns (stderr) when $ARCANOMY_CURRENT_REEL names another existing reel,
+    since _current_reel_path would keep returning that one in this shell.
+    """
+    resolved = reel_path.resolve()
+    CURRENT_REEL_FILE.write_text(str(resolved), encoding="utf-8")
+    _read_current_reel.cache_clear()
+
+    env_path = os.environ.get(CURRENT_REEL_ENV)
+    if (
+        warn_override
+        and env_path
+        and os.path.isdir(env_path)
+        and Path(env_path).resolve() != resolved
+    ):
+        typer.echo(
+            f"[WARN] {CURRENT_REEL_ENV}={env_path} still takes precedence in this shell.\n"
+            f"   Run: unset {CURRENT_REEL_ENV}  (or: eval \"$(uv run set {reel_path.name} --export)\")",
+            err=True,
+        )
+    return resolved
 
 
 def _get_current_reel(*, allow_missing: bool = False) -> Path | None:
@@ -45,7 +112,8 @@ def _get_current_reel(*, allow_missing: bool = False) -> Path | None:
         allow_missing: If True, return None instead of raising when no valid reel.
                        If False (default), raise typer.Exit(1) on error.
     """
-    if not CURRENT_REEL_FILE.exists():
+    reel_path = _current_reel_path()
+    if reel_path is None:
         if allow_missing:
             return None
         typer.echo("[INFO] No reel selected.")
@@ -58,7 +126,6 @@ def _get_current_reel(*, allow_missing: bool = False) -> Path | None:
         typer.echo("     uv run arcanomy new <slug>")
         raise typer.Exit(0)  # Not an error, just informational
     
-    reel_path = Path(CURRENT_REEL_FILE.read_text().strip())
     if not reel_path.exists():
         # Clean up stale reference - then behave as if no reel was selected
         try:
@@ -81,17 +148,99 @@ def _get_current_reel(*, allow_missing: bool = False) -> Path | None:
     return reel_path
 
 
+@lru_cache(maxsize=1)
+def _load_env() -> None:
+    """Load .env once per process (run-all calls every stage entry point)."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
+@lru_cache(maxsize=1)
+def _fetch_blogs_cached(limit: Optional[int], use_cache: bool = True) -> list:
+    """Fetch the featured blog index once per process."""
+    from src.services import fetch_featured_blogs
+
+    return fetch_featured_blogs(limit=limit, use_cache=use_cache)
+
+
+def _existing_paths(root: Path, rel_paths: Iterable[str]) -> set[str]:
+    """Return the subset of `rel_paths` (POSIX, relative to root) that exist.
+
+    Lists each parent directory once with os.scandir instead of stat'ing
+    every path separately.
+    """
+    by_parent: dict[str, list[str]] = {}
+    for rel in rel_paths:
+        by_parent.setdefault(rel.rpartition("/")[0], []).append(rel)
+
+    present: set[str] = set()
+    for parent, rels in by_parent.items():
+        try:
+            with os.scandir(os.path.join(root, parent)) as it:
+                names = {entry.name for entry in it}
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        present.update(rel for rel in rels if rel.rpartition("/")[2] in names)
+    return present
+
+
+def _find_reels(reels_dir: Path, query: str = "") -> list[Path]:
+    """Return reel folders in `reels_dir` whose name contains `query` (all by default).
+
+    Uses os.scandir: the name test runs first, and is_dir() answers from the
+    cached d_type, so non-matching entries cost no stat.
+    """
+    with os.scandir(reels_dir) as it:
+        return [Path(e.path) for e in it if query in e.name and e.is_dir()]
+
+
+def _iter_nul_records(stream, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """Yield the non-empty NUL-terminated records of a binary stream as they arrive."""
+    tail = b""
+    for chunk in iter(lambda: stream.read(chunk_size), b""):
+        *records, tail = (tail + chunk).split(b"\x00")
+        yield from filter(None, records)
+    if tail:
+        yield tail
+
+
+def _count_status_records(records: Iterator[bytes]) -> tuple[int, int]:
+    """Count (untracked, changed) entries in `git status -z --porcelain=v1` records."""
+    new_files = 0
+    modified = 0
+    for entry in records:
+        if entry[:2] == b"??":
+            new_files += 1
+        else:
+            modified += 1
+        if entry[:1] in (b"R", b"C"):
+            next(records, None)  # Renames/copies carry the source path as an extra record
+    return new_files, modified
+
+
+def _truncate(text: str, width: int) -> str:
+    """Cut `text` to `width` characters, adding "..." when shortened."""
+    return text if len(text) <= width else text[:width] + "..."
+
+
 def _print_context(reel_path: Path, stage_name: str = None):
     """Print current reel context."""
-    typer.echo(f"[Reel] {reel_path.name}")
+    lines = [f"[Reel] {reel_path.name}"]
     if stage_name:
-        typer.echo(f"[Stage] {stage_name}")
-    typer.echo("-" * 40)
+        lines.append(f"[Stage] {stage_name}")
+    lines.append("-" * 40)
+    typer.echo("\n".join(lines))
 
 
 @app.command("set")
 def set_reel(
     reel_path: str = typer.Argument(..., help="Path to the reel folder (can be partial)"),
+    export: bool = typer.Option(
+        False,
+        "--export",
+        help=f"Only print an export line for {CURRENT_REEL_ENV} (use with eval)",
+    ),
 ):
     """Set the current reel to work on."""
     path = Path(reel_path)
@@ -100,7 +249,7 @@ def set_reel(
     if not path.exists():
         reels_dir = Path("content/reels")
         if reels_dir.exists():
-            matches = [d for d in reels_dir.iterdir() if d.is_dir() and reel_path in d.name]
+            matches = _find_reels(reels_dir, reel_path)
             if len(matches) == 1:
                 path = matches[0]
             elif len(matches) > 1:
@@ -116,12 +265,21 @@ def set_reel(
         typer.echo(f"[ERROR] Reel folder not found: {path}", err=True)
         raise typer.Exit(1)
     
-    CURRENT_REEL_FILE.write_text(str(path.resolve()))
+    # With --export the caller is about to replace the variable, so don't warn
+    resolved = _set_current_reel(path, warn_override=not export)
     
-    typer.echo(f"[OK] Current reel set to: {path.name}")
-    typer.echo(f"   Full path: {path.resolve()}")
-    typer.echo(f"\n   Now you can run:")
-    typer.echo(f"   uv run arcanomy run {path}")
+    if export:
+        import shlex
+
+        typer.echo(f"export {CURRENT_REEL_ENV}={shlex.quote(str(resolved))}")
+        return
+    
+    typer.echo(
+        f"[OK] Current reel set to: {path.name}\n"
+        f"   Full path: {resolved}\n"
+        f"\n   Now you can run:\n"
+        f"   uv run arcanomy run {path}"
+    )
 
 
 @app.command()
@@ -144,11 +302,13 @@ def new(
     reel_name = f"{date.today().isoformat()}-{slug}"
     reel_path = output_dir / reel_name
 
-    if reel_path.exists():
+    # mkdir is the existence check, so two `new` runs cannot both claim the folder
+    try:
+        reel_path.mkdir(parents=True)
+    except FileExistsError:
         typer.echo(f"Error: Reel already exists at {reel_path}", err=True)
         raise typer.Exit(1)
 
-    reel_path.mkdir(parents=True)
     ensure_pipeline_layout(reel_path)
 
     # Create claim.json template
@@ -187,14 +347,204 @@ Dark, moody, cinematic. Gold accents on black.
     seed_path(reel_path).write_text(seed_content, encoding="utf-8")
 
     # Auto-set as current reel
-    CURRENT_REEL_FILE.write_text(str(reel_path.resolve()))
+    _set_current_reel(reel_path)
+
+    typer.echo(
+        f"[OK] Created new reel at: {reel_path}\n"
+        f"   (Also set as current reel)\n"
+        f"\n   Edit these files:\n"
+        f"   - {claim_path} (required)\n"
+        f"   - inputs/chart.json (optional, for chart reels)\n"
+        f"\n   Then run: uv run arcanomy run {reel_path}"
+    )
+
+
+# =============================================================================
+# Stage runners for `run` (module level so they can be bound with partial)
+# =============================================================================
+
+def _stage_init(reel_path: Path, *, fresh: bool, force: bool) -> None:
+    from src.pipeline import init as pipeline_init
+
+    prov_path = pipeline_init(reel_path, fresh=fresh, force=force)
+    typer.echo("[OK] Init complete")
+    typer.echo(f"   Provenance: {prov_path}")
+
+
+def _stage_plan(reel_path: Path, *, force: bool, ai: bool, ai_provider: Optional[str]) -> None:
+    from src.pipeline import generate_plan
+
+    plan_file = generate_plan(reel_path, force=force, ai=ai, ai_provider=ai_provider)
+    typer.echo("[OK] Plan complete")
+    typer.echo(f"   Plan: {plan_file}")
+
+
+def _stage_visual_plan(reel_path: Path, *, force: bool, ai: bool, ai_provider: Optional[str]) -> None:
+    from src.pipeline.visual_plan import generate_visual_plan
+
+    vp_file = generate_visual_plan(reel_path, force=force, ai=ai, provider_override=ai_provider)
+    typer.echo("[OK] Visual plan complete")
+    typer.echo(f"   Visual plan: {vp_file}")
+
+
+def _stage_seed_images(reel_path: Path, *, force: bool) -> None:
+    from src.pipeline.assets import generate_assets
+
+    assets = generate_assets(reel_path, force=force)
+    typer.echo("[OK] Seed images complete")
+    success = len([a for a in assets if a.get("status") == "success"])
+    typer.echo(f"   Generated: {success} images")
+
+
+def _stage_vidprompt(reel_path: Path, *, force: bool, ai: bool, ai_provider: Optional[str]) -> None:
+    from src.pipeline.vidprompt import generate_video_prompts
+
+    vp_prompts = generate_video_prompts(reel_path, force=force, ai=ai, provider_override=ai_provider)
+    typer.echo("[OK] Video prompts complete")
+    typer.echo(f"   Prompts: {vp_prompts}")
+
+
+def _stage_videos(reel_path: Path, *, force: bool) -> None:
+    from src.pipeline.videos import generate_videos
+
+    videos = generate_videos(reel_path, force=force)
+    typer.echo("[OK] Videos complete")
+    success = len([v for v in videos if v.get("status") == "success"])
+    typer.echo(f"   Generated: {success} clips")
+
+
+def _stage_subsegments(reel_path: Path, *, force: bool) -> None:
+    from src.pipeline import generate_subsegments
+
+    outputs = generate_subsegments(reel_path, force=force)
+    typer.echo("[OK] Subsegments complete")
+    out_dir = str(Path(outputs[0]).parent) if outputs else "subsegments"
+    typer.echo(f"   Wrote: {len(outputs)} clips -> {out_dir}")
+
+
+def _stage_voice(reel_path: Path, *, force: bool) -> None:
+    from src.pipeline import generate_voice
+
+    wavs = generate_voice(reel_path, force=force)
+    typer.echo("[OK] Voice complete")
+    wav_dir = str(Path(wavs[0]).parent) if wavs else "voice"
+    typer.echo(f"   Wrote: {len(wavs)} wavs -> {wav_dir}")
+
 
-    typer.echo(f"[OK] Created new reel at: {reel_path}")
-    typer.echo(f"   (Also set as current reel)")
-    typer.echo(f"\n   Edit these files:")
-    typer.echo(f"   - {claim_path} (required)")
-    typer.echo(f"   - inputs/chart.json (optional, for chart reels)")
-    typer.echo(f"\n   Then run: uv run arcanomy run {reel_path}")
+def _stage_captions(reel_path: Path, *, force: bool) -> None:
+    from src.pipeline import generate_captions_srt
+
+    srt = generate_captions_srt(reel_path, force=force)
+    typer.echo("[OK] Captions complete")
+    typer.echo(f"   SRT: {srt}")
+
+
+def _stage_charts(reel_path: Path, *, force: bool) -> None:
+    from src.pipeline import render_charts
+
+    charts = render_charts(reel_path, force=force)
+    typer.echo("[OK] Charts complete")
+    if charts:
+        typer.echo(f"   Wrote: {len(charts)} mp4 -> {Path(charts[0]).parent}")
+    else:
+        typer.echo("   Wrote: 0 (no chart jobs in plan.json)")
+
+
+def _stage_kit(reel_path: Path, *, force: bool) -> None:
+    from src.pipeline import generate_kit
+
+    kit = generate_kit(reel_path, force=force)
+    typer.echo("[OK] Kit complete")
+    typer.echo(f"   Thumbnail: {kit['thumbnail']}")
+    typer.echo(f"   Guide: {kit['capcut_guide']}")
+    typer.echo(f"   Checklist: {kit['retention_checklist']}")
+    typer.echo(f"   Quality gate: {kit['quality_gate']}")
+
+
+# Stage name -> (runner, `run` options it takes), in execution order.
+# `run -s <stage>` accepts these names.
+STAGE_TABLE = {
+    "init": (_stage_init, ("fresh", "force")),
+    "plan": (_stage_plan, ("force", "ai", "ai_provider")),
+    "visual_plan": (_stage_visual_plan, ("force", "ai", "ai_provider")),
+    "seed_images": (_stage_seed_images, ("force",)),
+    "vidprompt": (_stage_vidprompt, ("force", "ai", "ai_provider")),
+    "videos": (_stage_videos, ("force",)),
+    "subsegments": (_stage_subsegments, ("force",)),
+    "voice": (_stage_voice, ("force",)),
+    "captions": (_stage_captions, ("force",)),
+    "charts": (_stage_charts, ("force",)),
+    "kit": (_stage_kit, ("force",)),
+}
+PIPELINE_STAGES = tuple(STAGE_TABLE)
+
+# Stages each stage reads outputs from (used by `run --jobs` to overlap stages)
+STAGE_DEPS = {
+    "init": (),
+    "plan": ("init",),
+    "visual_plan": ("plan",),
+    "seed_images": ("visual_plan",),
+    "vidprompt": ("seed_images",),
+    "videos": ("vidprompt",),
+    "subsegments": ("plan",),
+    "voice": ("plan",),
+    "captions": ("voice",),
+    "charts": ("plan",),
+    "kit": PIPELINE_STAGES[:-1],
+}
+
+
+def _run_stage_graph(stage_runners: dict, stages: list[str], jobs: int) -> None:
+    """Run `stages` on a thread pool, starting each once its STAGE_DEPS finish.
+
+    Dependencies outside `stages` are treated as already satisfied. On the first
+    failure, queued stages are cancelled and the error is re-raised.
+    """
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+    pending = list(stages)
+    done: set[str] = set()
+    running = {}
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        while pending or running:
+            ready = [n for n in pending if all(d in done or d not in stages for d in STAGE_DEPS[n])]
+            for name in ready:
+                pending.remove(name)
+                running[pool.submit(stage_runners[name])] = name
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                try:
+                    future.result()
+                except BaseException:
+                    for other in running:
+                        other.cancel()
+                    raise
+                done.add(name)
+
+
+def _resolve_reel_arg(reel_path: Path) -> Path:
+    """Resolve a reel argument, falling back to a partial name in content/reels.
+
+    Exits when the partial name matches several reels; a path that matches
+    nothing is returned unchanged for the caller to report.
+    """
+    if reel_path.exists():
+        return reel_path
+    reels_dir = Path("content/reels")
+    if not reels_dir.exists():
+        return reel_path
+    matches = _find_reels(reels_dir, str(reel_path))
+    if len(matches) == 1:
+        typer.echo(f"[Reel] Found: {matches[0].name}")
+        return matches[0]
+    if len(matches) > 1:
+        typer.echo(f"[ERROR] Multiple reels match '{reel_path}':", err=True)
+        for m in matches:
+            typer.echo(f"   - {m.name}")
+        raise typer.Exit(1)
+    return reel_path
 
 
 @app.command()
@@ -207,7 +557,7 @@ def run(
         None,
         "--stage",
         "-s",
-        help="Run ONLY this stage: init|plan|visual_plan|seed_images|vidprompt|videos|subsegments|voice|captions|charts|kit. Omit to run all.",
+        help=f"Run ONLY this stage: {'|'.join(PIPELINE_STAGES)}. Omit to run all.",
     ),
     fresh: bool = typer.Option(
         False,
@@ -229,21 +579,26 @@ def run(
         "--ai-provider",
         help="Override LLM provider (openai|anthropic|gemini).",
     ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        help="Run up to N independent stages at once (e.g. voice and charts alongside visuals).",
+    ),
 ):
     """Run the pipeline for a reel.
     
     With no -s flag: runs ALL stages in order.
     With -s <stage>: runs ONLY that one stage.
+    With -j N: overlaps stages that do not depend on each other.
     
     Stages: init → plan → visual_plan → seed_images → vidprompt → videos → subsegments → voice → captions → charts → kit
     """
-    from dotenv import load_dotenv
-
-    load_dotenv()
+    _load_env()
 
     # If no path provided, use current reel
     if reel_path is None:
-        if not CURRENT_REEL_FILE.exists():
+        if _current_reel_path() is None:
             typer.echo("[ERROR] No reel specified and no current reel set.", err=True)
             typer.echo("", err=True)
             typer.echo("   Either provide a path:", err=True)
@@ -256,32 +611,21 @@ def run(
         reel_path = _get_current_reel()
         typer.echo(f"[Reel] Using current reel: {reel_path.name}")
     else:
-        reel_path = Path(reel_path)
-        # Also try to find by partial name in content/reels
-        if not reel_path.exists():
-            reels_dir = Path("content/reels")
-            if reels_dir.exists():
-                matches = [d for d in reels_dir.iterdir() if d.is_dir() and str(reel_path) in d.name]
-                if len(matches) == 1:
-                    reel_path = matches[0]
-                    typer.echo(f"[Reel] Found: {reel_path.name}")
-                elif len(matches) > 1:
-                    typer.echo(f"[ERROR] Multiple reels match '{reel_path}':", err=True)
-                    for m in matches:
-                        typer.echo(f"   - {m.name}")
-                    raise typer.Exit(1)
+        reel_path = _resolve_reel_arg(Path(reel_path))
     
     if not reel_path.exists():
         typer.echo(f"Error: Reel not found at {reel_path}", err=True)
         raise typer.Exit(1)
     
     # Auto-set as current reel for convenience
-    CURRENT_REEL_FILE.write_text(str(reel_path.resolve()))
+    _set_current_reel(reel_path)
 
-    valid_stages = ("init", "plan", "visual_plan", "seed_images", "vidprompt", "videos", "subsegments", "voice", "captions", "charts", "kit")
-    
-    if stage is not None and stage not in valid_stages:
-        typer.echo(f"[ERROR] --stage must be one of: {', '.join(valid_stages)}", err=True)
+    if stage is not None and stage not in PIPELINE_STAGES:
+        typer.echo(f"[ERROR] --stage must be one of: {', '.join(PIPELINE_STAGES)}", err=True)
+        raise typer.Exit(1)
+
+    if jobs < 1:
+        typer.echo("[ERROR] --jobs must be at least 1", err=True)
         raise typer.Exit(1)
 
     ai = not no_ai  # AI is default, --no-ai disables it
@@ -289,7 +633,7 @@ def run(
     # Determine which stages to run
     if stage is None:
         # Run all stages
-        stages_to_run = list(valid_stages)
+        stages_to_run = list(PIPELINE_STAGES)
         typer.echo("[Pipeline] Running all stages")
     else:
         # Run only the specified stage
@@ -299,88 +643,94 @@ def run(
     if no_ai:
         typer.echo("[Mode] AI disabled (--no-ai)")
 
-    # Stage runners
-    def run_init():
-        prov_path = pipeline_init(reel_path, fresh=fresh, force=force)
-        typer.echo("[OK] Init complete")
-        typer.echo(f"   Provenance: {prov_path}")
+    # Bind only the stages being run to this reel and these options
+    options = {"fresh": fresh, "force": force, "ai": ai, "ai_provider": ai_provider}
+    stage_runners = {}
+    for name in stages_to_run:
+        fn, option_names = STAGE_TABLE[name]
+        stage_runners[name] = partial(fn, reel_path, **{k: options[k] for k in option_names})
 
-    def run_plan():
-        plan_file = generate_plan(reel_path, force=force, ai=ai, ai_provider=ai_provider)
-        typer.echo("[OK] Plan complete")
-        typer.echo(f"   Plan: {plan_file}")
-
-    def run_visual_plan():
-        vp_file = generate_visual_plan(reel_path, force=force, ai=ai, provider_override=ai_provider)
-        typer.echo("[OK] Visual plan complete")
-        typer.echo(f"   Visual plan: {vp_file}")
-
-    def run_seed_images():
-        assets = generate_assets(reel_path, force=force)
-        typer.echo("[OK] Seed images complete")
-        success = len([a for a in assets if a.get("status") == "success"])
-        typer.echo(f"   Generated: {success} images")
-
-    def run_vidprompt():
-        vp_prompts = generate_video_prompts(reel_path, force=force, ai=ai, provider_override=ai_provider)
-        typer.echo("[OK] Video prompts complete")
-        typer.echo(f"   Prompts: {vp_prompts}")
-
-    def run_videos():
-        videos = generate_videos(reel_path, force=force)
-        typer.echo("[OK] Videos complete")
-        success = len([v for v in videos if v.get("status") == "success"])
-        typer.echo(f"   Generated: {success} clips")
-
-    def run_subsegments():
-        outputs = generate_subsegments(reel_path, force=force)
-        typer.echo("[OK] Subsegments complete")
-        out_dir = str(Path(outputs[0]).parent) if outputs else "subsegments"
-        typer.echo(f"   Wrote: {len(outputs)} clips -> {out_dir}")
-
-    def run_voice():
-        wavs = generate_voice(reel_path, force=force)
-        typer.echo("[OK] Voice complete")
-        wav_dir = str(Path(wavs[0]).parent) if wavs else "voice"
-        typer.echo(f"   Wrote: {len(wavs)} wavs -> {wav_dir}")
-
-    def run_captions():
-        srt = generate_captions_srt(reel_path, force=force)
-        typer.echo("[OK] Captions complete")
-        typer.echo(f"   SRT: {srt}")
-
-    def run_charts():
-        charts = render_charts(reel_path, force=force)
-        typer.echo("[OK] Charts complete")
-        if charts:
-            typer.echo(f"   Wrote: {len(charts)} mp4 -> {Path(charts[0]).parent}")
-        else:
-            typer.echo("   Wrote: 0 (no chart jobs in plan.json)")
-
-    def run_kit():
-        kit = generate_kit(reel_path, force=force)
-        typer.echo("[OK] Kit complete")
-        typer.echo(f"   Thumbnail: {kit['thumbnail']}")
-        typer.echo(f"   Guide: {kit['capcut_guide']}")
-        typer.echo(f"   Checklist: {kit['retention_checklist']}")
-        typer.echo(f"   Quality gate: {kit['quality_gate']}")
-
-    stage_runners = {
-        "init": run_init,
-        "plan": run_plan,
-        "visual_plan": run_visual_plan,
-        "seed_images": run_seed_images,
-        "vidprompt": run_vidprompt,
-        "videos": run_videos,
-        "subsegments": run_subsegments,
-        "voice": run_voice,
-        "captions": run_captions,
-        "charts": run_charts,
-        "kit": run_kit,
-    }
+    if jobs > 1 and len(stages_to_run) > 1:
+        _run_stage_graph(stage_runners, stages_to_run, jobs)
+    else:
+        for s in stages_to_run:
+            stage_runners[s]()
 
-    for s in stages_to_run:
-        stage_runners[s]()
+
+def _run_reel_stages(reel_path: Path, options: dict) -> None:
+    """Run every pipeline stage for one reel (process-pool worker for run-many)."""
+    _load_env()
+    typer.echo(f"[Reel] {reel_path.name}: starting")
+    for fn, option_names in STAGE_TABLE.values():
+        fn(reel_path, **{k: options[k] for k in option_names})
+
+
+@app.command("run-many")
+def run_many(
+    reel_paths: list[Path] = typer.Argument(..., help="Reel folders or partial names to run"),
+    jobs: Optional[int] = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        help="Reels to run at once (default: one per reel, up to the CPU count).",
+    ),
+    fresh: bool = typer.Option(
+        False,
+        "--fresh",
+        help="Wipe and recreate outputs before running.",
+    ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        help="Allow overwriting immutable outputs (use sparingly).",
+    ),
+    no_ai: bool = typer.Option(
+        False,
+        "--no-ai",
+        help="Disable AI/LLM and use placeholder scripts (for testing without API key).",
+    ),
+    ai_provider: Optional[str] = typer.Option(
+        None,
+        "--ai-provider",
+        help="Override LLM provider (openai|anthropic|gemini).",
+    ),
+):
+    """Run the full pipeline for several reels in parallel processes.
+
+    Each reel runs all stages in order in its own worker process.
+    Does not change the current reel.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    reel_paths = [_resolve_reel_arg(p) for p in reel_paths]
+    missing = [p for p in reel_paths if not p.is_dir()]
+    if missing:
+        for p in missing:
+            typer.echo(f"Error: Reel not found at {p}", err=True)
+        raise typer.Exit(1)
+
+    if jobs is not None and jobs < 1:
+        typer.echo("[ERROR] --jobs must be at least 1", err=True)
+        raise typer.Exit(1)
+
+    workers = jobs or min(len(reel_paths), os.cpu_count() or 1)
+    options = {"fresh": fresh, "force": force, "ai": not no_ai, "ai_provider": ai_provider}
+    typer.echo(f"[Pipeline] Running {len(reel_paths)} reels with {workers} workers")
+
+    failed = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(_run_reel_stages, p, options): p for p in reel_paths}
+        for future, reel in futures.items():
+            try:
+                future.result()
+                typer.echo(f"[OK] {reel.name}")
+            except Exception as e:
+                failed.append(reel)
+                typer.echo(f"[ERROR] {reel.name}: {e}", err=True)
+
+    if failed:
+        typer.echo(f"[ERROR] {len(failed)} of {len(reel_paths)} reels failed", err=True)
+        raise typer.Exit(1)
 
 
 @app.command()
@@ -400,33 +750,17 @@ def status(
         typer.echo(f"Error: Reel not found at {reel_path}", err=True)
         raise typer.Exit(1)
 
-    stages = [
-        ("inputs/claim.json", "Claim (input)"),
-        ("inputs/chart.json", "Chart (optional)"),
-        ("meta/provenance.json", "Provenance"),
-        ("meta/plan.json", "Plan"),
-        ("meta/visual_plan.json", "Visual Plan"),
-        ("renders/images/composites", "Assets (images)"),
-        ("meta/video_prompts.json", "Video Prompts"),
-        ("renders/videos", "Videos"),
-        ("subsegments/subseg-01.mp4", "Subsegments"),
-        ("voice/subseg-01.wav", "Voice"),
-        ("captions/captions.srt", "Captions"),
-        ("thumbnail/thumbnail.png", "Thumbnail"),
-        ("guides/capcut_assembly_guide.md", "CapCut Guide"),
-        ("guides/retention_checklist.md", "Retention Checklist"),
-        ("meta/quality_gate.json", "Quality Gate"),
-    ]
-
-    typer.echo(f"\nPipeline status for: {reel_path.name}\n")
-    for filename, name in stages:
-        exists = (reel_path / filename).exists()
-        status_str = "[x]" if exists else "[ ]"
-        typer.echo(f"  {status_str} {name}")
+    present = _existing_paths(reel_path, (filename for filename, _ in STATUS_FILES))
+
+    lines = [f"\nPipeline status for: {reel_path.name}\n"]
+    for filename, name in STATUS_FILES:
+        status_str = "[x]" if filename in present else "[ ]"
+        lines.append(f"  {status_str} {name}")
+    typer.echo("\n".join(lines))
 
     # Check quality gate pass/fail
     qg_path = reel_path / "meta" / "quality_gate.json"
-    if qg_path.exists():
+    if "meta/quality_gate.json" in present:
         qg = json.loads(qg_path.read_text(encoding="utf-8"))
         passed = qg.get("pass", False)
         reasons = qg.get("reasons", [])
@@ -458,26 +792,13 @@ def current():
     typer.echo(f"   Path: {reel_path}")
     
     # Show quick status
-    typer.echo(f"\n   Status:")
-    stages = [
-        ("inputs/claim.json", "Claim"),
-        ("meta/provenance.json", "Init"),
-        ("meta/plan.json", "Plan"),
-        ("meta/visual_plan.json", "Visual Plan"),
-        ("renders/images/composites", "Assets"),
-        ("meta/video_prompts.json", "Vidprompt"),
-        ("renders/videos", "Videos"),
-        ("subsegments/subseg-01.mp4", "Subsegments"),
-        ("voice/subseg-01.wav", "Voice"),
-        ("captions/captions.srt", "Captions"),
-        ("charts", "Charts"),
-        ("thumbnail/thumbnail.png", "Thumbnail"),
-        ("meta/quality_gate.json", "Quality Gate"),
-    ]
-    for filename, name in stages:
-        exists = (reel_path / filename).exists()
-        status_str = "[x]" if exists else "[ ]"
-        typer.echo(f"   {status_str} {name}")
+    present = _existing_paths(reel_path, (filename for filename, _ in CURRENT_STATUS_FILES))
+
+    lines = [f"\n   Status:"]
+    for filename, name in CURRENT_STATUS_FILES:
+        status_str = "[x]" if filename in present else "[ ]"
+        lines.append(f"   {status_str} {name}")
+    typer.echo("\n".join(lines))
 
 
 @app.command()
@@ -493,7 +814,7 @@ def reels():
         typer.echo("[ERROR] No reels directory found at content/reels")
         raise typer.Exit(1)
     
-    reel_dirs = sorted([d for d in reels_dir.iterdir() if d.is_dir()], reverse=True)
+    reel_dirs = sorted(_find_reels(reels_dir), reverse=True)
     
     if not reel_dirs:
         typer.echo("No reels found. Create one with:")
@@ -502,11 +823,12 @@ def reels():
     
     # Get current reel for highlighting
     current_reel = None
-    if CURRENT_REEL_FILE.exists():
-        try:
-            current_reel = Path(CURRENT_REEL_FILE.read_text().strip())
-        except Exception:
-            pass
+    try:
+        current_reel = _current_reel_path()
+        if current_reel is not None:
+            current_reel = current_reel.resolve()
+    except Exception:
+        pass
     
     table = Table(title=f"Available Reels ({len(reel_dirs)})")
     table.add_column("#", style="bold cyan", width=3)
@@ -530,7 +852,7 @@ def reels():
         else:
             status = "[dim]Empty[/dim]"
         
-        is_current = current_reel and reel.resolve() == current_reel.resolve()
+        is_current = current_reel and reel.resolve() == current_reel
         current_marker = "[cyan]<< current[/cyan]" if is_current else ""
         
         table.add_row(str(i), reel.name, status, current_marker)
@@ -545,7 +867,7 @@ def reels():
             idx = int(choice) - 1
             if 0 <= idx < len(reel_dirs):
                 selected = reel_dirs[idx]
-                CURRENT_REEL_FILE.write_text(str(selected.resolve()))
+                _set_current_reel(selected)
                 typer.echo(f"\n[OK] Current reel set to: {selected.name}")
             else:
                 typer.echo(f"[ERROR] Invalid selection. Enter 1-{len(reel_dirs)}", err=True)
@@ -598,39 +920,33 @@ def commit(
     ),
 ):
     """Stage, commit, and push all changes."""
-    import subprocess
-
-    # Check for changes
-    result = subprocess.run(
-        ["git", "status", "--porcelain"],
-        capture_output=True,
-        text=True,
-    )
-    lines = [l for l in result.stdout.strip().split("\n") if l]
-
-    if not lines:
-        typer.echo("No changes to commit")
-        return
+    # With -m the status listing would only be used to bail out early, and
+    # `git commit` below already reports a clean tree, so skip it.
+    if not message:
+        # Count changes as git status streams them (-z: NUL-separated records,
+        # paths are never quoted); only the counts are used, so paths are never
+        # decoded. GIT_OPTIONAL_LOCKS=0: only the output is needed, so skip
+        # status's opportunistic index refresh write (and index.lock).
+        with subprocess.Popen(
+            ["git", "status", "-z", "--porcelain=v1"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env={**os.environ, "GIT_OPTIONAL_LOCKS": "0"},
+        ) as status_proc:
+            new_files, modified = _count_status_records(
+                _iter_nul_records(status_proc.stdout)
+            )
 
-    # Categorize changes
-    new_files = []
-    modified = []
-    for line in lines:
-        status = line[:2].strip()
-        filepath = line[3:]
-        if "?" in status:
-            new_files.append(filepath)
-        else:
-            modified.append(filepath)
+        if not new_files and not modified:
+            typer.echo("No changes to commit")
+            return
 
-    # Build auto message if not provided
-    if not message:
         parts = []
         if new_files:
-            parts.append(f"add {len(new_files)} files")
+            parts.append(f"add {new_files} files")
         if modified:
-            parts.append(f"update {len(modified)} files")
-        message = ", ".join(parts) if parts else "update"
+            parts.append(f"update {modified} files")
+        message = ", ".join(parts)
 
     # Git add
     typer.echo("Staging changes...")
@@ -701,7 +1017,7 @@ def list_reels_cmd(
         # Check which are already fetched locally
         local_ids = set()
         if reels_dir.exists():
-            local_ids = {d.name for d in reels_dir.iterdir() if d.is_dir()}
+            local_ids = {d.name for d in _find_reels(reels_dir)}
 
         console.print(f"\n[bold]Available Reels on CDN ({len(reels)})[/bold]\n")
         
@@ -732,7 +1048,7 @@ def list_reels_cmd(
                             output_dir=reels_dir, 
                             overwrite=True
                         )
-                        CURRENT_REEL_FILE.write_text(str(reel_path.resolve()))
+                        _set_current_reel(reel_path)
                         typer.echo(f"[OK] Fetched and set as current reel")
                         typer.echo(f"\n   Next: uv run arcanomy run")
                     except Exception as e:
@@ -748,7 +1064,7 @@ def list_reels_cmd(
             typer.echo("No local reels directory found.")
             return
 
-        local_reels = sorted([d for d in reels_dir.iterdir() if d.is_dir()], reverse=True)
+        local_reels = sorted(_find_reels(reels_dir), reverse=True)
 
         if not local_reels:
             typer.echo("No local reels found.")
@@ -756,11 +1072,12 @@ def list_reels_cmd(
 
         # Get current reel for highlighting
         current_reel = None
-        if CURRENT_REEL_FILE.exists():
-            try:
-                current_reel = Path(CURRENT_REEL_FILE.read_text().strip())
-            except Exception:
-                pass
+        try:
+            current_reel = _current_reel_path()
+            if current_reel is not None:
+                current_reel = current_reel.resolve()
+        except Exception:
+            pass
 
         console.print(f"\n[bold]Local Reels ({len(local_reels)})[/bold]\n")
 
@@ -778,7 +1095,7 @@ def list_reels_cmd(
             else:
                 status = "[dim]Empty[/dim]"
 
-            is_current = current_reel and reel.resolve() == current_reel.resolve()
+            is_current = current_reel and reel.resolve() == current_reel
             current_marker = " << current" if is_current else ""
             
             console.print(f"  {i}. [bold]{reel.name}[/bold] {status}{current_marker}")
@@ -793,7 +1110,7 @@ def list_reels_cmd(
                 idx = int(choice) - 1
                 if 0 <= idx < len(local_reels):
                     selected = local_reels[idx]
-                    CURRENT_REEL_FILE.write_text(str(selected.resolve()))
+                    _set_current_reel(selected)
                     typer.echo(f"\n[OK] Current reel set to: {selected.name}")
                     typer.echo(f"\n   Next: uv run arcanomy run")
                 else:
@@ -857,10 +1174,12 @@ def fetch_reel_cmd(
             typer.echo(f"   - {f}")
 
     # Set as current reel
-    CURRENT_REEL_FILE.write_text(str(reel_path.resolve()))
+    _set_current_reel(reel_path)
     typer.echo(f"   (Set as current reel)")
 
     if run_pipeline:
+        from src.pipeline import init as pipeline_init, generate_plan
+
         typer.echo("\n" + "=" * 40)
         typer.echo("[Pipeline] Running...")
 
@@ -913,7 +1232,7 @@ def validate_cmd(
             # Try to find by partial name
             reels_dir = Path("content/reels")
             if reels_dir.exists():
-                matches = [d for d in reels_dir.iterdir() if d.is_dir() and str(reel_path) in d.name]
+                matches = _find_reels(reels_dir, str(reel_path))
                 if len(matches) == 1:
                     reel_path = matches[0]
                 elif len(matches) > 1:
@@ -957,16 +1276,20 @@ def validate_cmd(
 @app.command("list-blogs", hidden=True)
 def list_blogs(
     limit: int = typer.Option(10, "--limit", "-n", help="Number of blogs to show"),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Re-download the blog index instead of using the local .cache copy",
+    ),
+    tsv: bool = typer.Option(
+        False,
+        "--tsv",
+        help="Print tab-separated rows (#, published, title, category, identifier) for scripts",
+    ),
 ):
     """List available blog posts from Arcanomy CDN. (Legacy - use list-reels instead)"""
-    from rich.console import Console
-    from rich.table import Table
-    from src.services import fetch_featured_blogs
-
-    console = Console()
-    
     try:
-        blogs = fetch_featured_blogs(limit=limit)
+        blogs = _fetch_blogs_cached(limit, use_cache=not no_cache)
     except Exception as e:
         typer.echo(f"[ERROR] Failed to fetch blogs: {e}", err=True)
         raise typer.Exit(1)
@@ -974,7 +1297,18 @@ def list_blogs(
     if not blogs:
         typer.echo("No blogs found.")
         return
-    
+
+    if tsv:
+        typer.echo("\n".join(
+            f"{i}\t{(blog.published_date or '')[:10]}\t{blog.title}\t{blog.category}\t{blog.identifier}"
+            for i, blog in enumerate(blogs, 1)
+        ))
+        return
+
+    from rich.console import Console
+    from rich.table import Table
+
+    console = Console()
     table = Table(title=f"Available Blogs ({len(blogs)})")
     table.add_column("#", style="bold cyan", width=3)
     table.add_column("Published", style="dim")
@@ -985,11 +1319,66 @@ def list_blogs(
         table.add_row(
             str(i),
             blog.published_date[:10] if blog.published_date else "",
-            blog.title[:40] + ("..." if len(blog.title) > 40 else ""),
+            _truncate(blog.title, 40),
+            blog.category,
+        )
+    
+    console.print(table)
+
+
+def _pick_blog(blogs: list, console):
+    """Show the blog picker table and return the chosen blog."""
+    from rich.table import Table
+
+    table = Table(title="Pick a blog")
+    table.add_column("#", style="bold cyan", width=3)
+    table.add_column("Published", style="dim")
+    table.add_column("Title", style="bold")
+    table.add_column("Category")
+    
+    for i, blog in enumerate(blogs, 1):
+        table.add_row(
+            str(i),
+            blog.published_date[:10] if blog.published_date else "",
+            _truncate(blog.title, 50),
             blog.category,
         )
     
     console.print(table)
+    console.print()
+    
+    choice = typer.prompt("Enter number to select", default="1")
+    
+    try:
+        idx = int(choice) - 1
+        if 0 <= idx < len(blogs):
+            return blogs[idx]
+        typer.echo(f"[ERROR] Invalid selection. Enter 1-{len(blogs)}", err=True)
+        raise typer.Exit(1)
+    except ValueError:
+        typer.echo("[ERROR] Enter a number", err=True)
+        raise typer.Exit(1)
+
+
+def _match_blog(blogs: list, identifier: str):
+    """Find a blog by exact identifier, else by a unique partial match."""
+    by_id = {b.identifier: b for b in blogs}
+    selected_blog = by_id.get(identifier)
+    if selected_blog:
+        return selected_blog
+
+    # Try partial match (case-insensitive) over the index keys
+    query = identifier.lower()
+    matches = [b for key, b in by_id.items() if query in key.lower()]
+    if len(matches) == 1:
+        return matches[0]
+    if len(matches) > 1:
+        typer.echo(f"[ERROR] Multiple blogs match '{identifier}':", err=True)
+        for m in matches:
+            typer.echo(f"   - {m.identifier}")
+        raise typer.Exit(1)
+    typer.echo(f"[ERROR] No blog found matching: {identifier}", err=True)
+    raise typer.Exit(1)
 
 
 @app.command("ingest-blog", hidden=True)
@@ -1034,75 +1423,52 @@ def ingest_blog(
         "--no-ai",
         help="Disable AI and use placeholder scripts",
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Re-download the blog index and content instead of using the local .cache copy",
+    ),
 ):
     """Create a reel from a blog post. Interactive picker if no identifier provided."""
+    from concurrent.futures import ThreadPoolExecutor
     from rich.console import Console
-    from rich.table import Table
-    from dotenv import load_dotenv
-    from src.services import fetch_featured_blogs, fetch_blog_mdx, extract_seed_and_config, LLMService
+    from src.services import fetch_blog_mdx, fetch_blog_meta
+    from src.services.blog_ingest import warm_seed_pipeline_clients
     
-    load_dotenv()
+    _load_env()
     console = Console()
     
-    # Fetch blogs
-    try:
-        blogs = fetch_featured_blogs(limit=limit)
-    except Exception as e:
-        typer.echo(f"[ERROR] Failed to fetch blogs: {e}", err=True)
-        raise typer.Exit(1)
-    
-    if not blogs:
-        typer.echo("No blogs found.")
-        raise typer.Exit(1)
-    
-    # If no identifier, show interactive picker
+    # Build the LLM clients while the blog is fetched (or picked)
+    prefetch = ThreadPoolExecutor(max_workers=1)
+    warm_future = prefetch.submit(warm_seed_pipeline_clients)
+    prefetch.shutdown(wait=False)
+
+    # With an identifier, look the post up by its own manifest. The featured
+    # index is only needed for the picker or when the identifier is partial
+    # (no manifest at that path).
     selected_blog = None
-    if identifier is None:
-        table = Table(title="Pick a blog")
-        table.add_column("#", style="bold cyan", width=3)
-        table.add_column("Published", style="dim")
-        table.add_column("Title", style="bold")
-        table.add_column("Category")
-        
-        for i, blog in enumerate(blogs, 1):
-            table.add_row(
-                str(i),
-                blog.published_date[:10] if blog.published_date else "",
-                blog.title[:50] + ("..." if len(blog.title) > 50 else ""),
-                blog.category,
-            )
-        
-        console.print(table)
-        console.print()
-        
-        choice = typer.prompt("Enter number to select", default="1")
-        
+    if identifier is not None:
         try:
-            idx = int(choice) - 1
-            if 0 <= idx < len(blogs):
-                selected_blog = blogs[idx]
-            else:
-                typer.echo(f"[ERROR] Invalid selection. Enter 1-{len(blogs)}", err=True)
-                raise typer.Exit(1)
-        except ValueError:
-            typer.echo("[ERROR] Enter a number", err=True)
+            selected_blog = fetch_blog_meta(identifier, use_cache=not no_cache)
+        except Exception:
+            selected_blog = None
+
+    if selected_blog is None:
+        # Fetch blogs
+        try:
+            blogs = _fetch_blogs_cached(limit, use_cache=not no_cache)
+        except Exception as e:
+            typer.echo(f"[ERROR] Failed to fetch blogs: {e}", err=True)
             raise typer.Exit(1)
-    else:
-        # Find by identifier
-        selected_blog = next((b for b in blogs if b.identifier == identifier), None)
-        if not selected_blog:
-            # Try partial match
-            matches = [b for b in blogs if identifier.lower() in b.identifier.lower()]
-            if len(matches) == 1:
-                selected_blog = matches[0]
-            elif len(matches) > 1:
-                typer.echo(f"[ERROR] Multiple blogs match '{identifier}':", err=True)
-                for m in matches:
-                    typer.echo(f"   - {m.identifier}")
-                raise typer.Exit(1)
-            else:
-                typer.echo(f"[ERROR] No blog found matching: {identifier}", err=True)
-                raise typer.Exit(1)
+
+        if not blogs:
+            typer.echo("No blogs found.")
+            raise typer.Exit(1)
+
+        if identifier is None:
+            selected_blog = _pick_blog(blogs, console)
+        else:
+            selected_blog = _match_blog(blogs, identifier)
     
     typer.echo(f"\n[Blog] Selected: {selected_blog.title}")
     typer.echo(f"   Identifier: {selected_blog.identifier}")
@@ -1110,7 +1476,7 @@ def ingest_blog(
     # Fetch MDX content
     typer.echo("[Blog] Fetching content...")
     try:
-        mdx_content = fetch_blog_mdx(selected_blog.identifier)
+        mdx_content = fetch_blog_mdx(selected_blog.identifier, use_cache=not no_cache)
     except Exception as e:
         typer.echo(f"[ERROR] Failed to fetch blog content: {e}", err=True)
         raise typer.Exit(1)
@@ -1122,6 +1488,12 @@ def ingest_blog(
     typer.echo("[LLM] Starting 3-step extraction pipeline...")
     typer.echo("   (Anthropic -> OpenAI -> Anthropic)")
     
+    # The warm-up is best effort; extraction builds any client it lacks
+    try:
+        warm_future.result()
+    except Exception as e:
+        typer.echo(f"[WARN] LLM client warm-up failed: {e}", err=True)
+    
     try:
         seed_content, config, chart_json = extract_seed_pipeline(
             mdx_content=mdx_content,
@@ -1143,15 +1515,16 @@ def ingest_blog(
     
     reel_path = output_dir / reel_name
     
-    # Check if folder exists and warn if it will be overwritten
-    if reel_path.exists():
+    # Create the folder, warning if it already exists and will be overwritten
+    try:
+        reel_path.mkdir(parents=True)
+    except FileExistsError:
         if slug:
             typer.echo(f"[WARN] Reel folder already exists, will update: {reel_name}")
         else:
             typer.echo(f"[INFO] Updating existing reel: {reel_name}")
             typer.echo(f"   (Use --slug to create a separate reel from same blog)")
     
-    reel_path.mkdir(parents=True, exist_ok=True)
     ensure_pipeline_layout(reel_path)
     
     # Write claim.json (from extracted config)
@@ -1178,7 +1551,7 @@ def ingest_blog(
         chart_file.write_text(json.dumps(chart_json, indent=2) + "\n", encoding="utf-8")
     
     # Set as current reel
-    CURRENT_REEL_FILE.write_text(str(reel_path.resolve()))
+    _set_current_reel(reel_path)
     
     typer.echo(f"\n[OK] Created reel: {reel_path.name}")
     typer.echo(f"   Claim: {claim_path}")
@@ -1189,6 +1562,8 @@ def ingest_blog(
     
     # Optionally run pipeline
     if run_pipeline:
+        from src.pipeline import init as pipeline_init, generate_plan
+
         typer.echo("\n" + "=" * 40)
         typer.echo("[Pipeline] Running...")
         
@@ -1206,22 +1581,8 @@ def ingest_blog(
         typer.echo(f"   2. Run:    uv run arcanomy run")
 
 
-@app.command()
-def guide():
-    """Show complete workflow guide."""
-    from rich.console import Console
-    from rich.panel import Panel
-    
-    console = Console()
-    
-    console.print()
-    console.print(Panel.fit(
-        "[bold cyan]Arcanomy Motion - CapCut Kit Pipeline[/bold cyan]\n"
-        "[dim]Generate CapCut-ready assembly kits for short-form video[/dim]",
-        border_style="cyan"
-    ))
-    
-    workflow = """
+# Static guide body; only the current-reel footer varies between calls
+GUIDE_WORKFLOW = """
 [bold]WORKFLOW: From CDN (Studio-generated seeds)[/bold]
 
 1. [cyan]List and fetch:[/cyan]
@@ -1288,68 +1649,71 @@ content/reels/<reel>/
   uv run arcanomy preview           Start Remotion preview
   uv run arcanomy render-chart <json>  Render standalone chart
 """
-    console.print(workflow)
+
+
+@app.command()
+def guide():
+    """Show complete workflow guide."""
+    from rich.console import Console
+    from rich.panel import Panel
     
-    if CURRENT_REEL_FILE.exists():
-        try:
-            reel_path = Path(CURRENT_REEL_FILE.read_text().strip())
-            if reel_path.exists():
-                console.print(f"\n[bold green]Current reel:[/bold green] {reel_path.name}")
-        except Exception:
-            pass
+    footer = ""
+    try:
+        reel_path = _current_reel_path()
+        if reel_path is not None and reel_path.exists():
+            footer = f"\n[bold green]Current reel:[/bold green] {reel_path.name}\n"
+    except Exception:
+        pass
     
-    console.print()
+    # Entering the console buffers every print and writes the guide out once
+    console = Console()
+    with console:
+        console.print()
+        console.print(Panel.fit(
+            "[bold cyan]Arcanomy Motion - CapCut Kit Pipeline[/bold cyan]\n"
+            "[dim]Generate CapCut-ready assembly kits for short-form video[/dim]",
+            border_style="cyan"
+        ))
+        console.print(GUIDE_WORKFLOW)
+        console.print(footer)
 
 
 # Shorthand entry points for `uv run <cmd>` without the arcanomy prefix
-# These are thin wrappers that invoke the same typer commands.
+# These route through the main app so no extra Typer instances are built.
+
+def _dispatch(cmd_name: str) -> None:
+    """Invoke `arcanomy <cmd_name>` with this process's CLI arguments."""
+    app(args=[cmd_name, *sys.argv[1:]], prog_name="uv run")
 
-_set_app = typer.Typer()
-_set_app.command()(set_reel)
 
 def _run_set():
     """Entry point for 'uv run set'."""
-    _set_app()
+    _dispatch("set")
 
 
-_current_app = typer.Typer()
-_current_app.command()(current)
-
 def _run_current():
     """Entry point for 'uv run current'."""
-    _current_app()
-
+    _dispatch("current")
 
-_guide_app = typer.Typer()
-_guide_app.command()(guide)
 
 def _run_guide():
     """Entry point for 'uv run guide'."""
-    _guide_app()
-
+    _dispatch("guide")
 
-_reels_app = typer.Typer()
-_reels_app.command()(reels)
 
 def _run_reels():
     """Entry point for 'uv run reels'."""
-    _reels_app()
+    _dispatch("reels")
 
 
-_chart_app = typer.Typer()
-_chart_app.command()(render_chart)
-
 def _run_chart():
     """Entry point for 'uv run chart'."""
-    _chart_app()
-
+    _dispatch("render-chart")
 
-_commit_app = typer.Typer()
-_commit_app.command()(commit)
 
 def run_commit():
     """Entry point for 'uv run commit'."""
-    _commit_app()
+    _dispatch("commit")
 
 
 # =============================================================================
@@ -1359,11 +1723,11 @@ def run_commit():
 
 def _get_reel_or_exit() -> Path:
     """Get current reel path or exit with helpful message."""
-    if not CURRENT_REEL_FILE.exists():
+    reel_path = _current_reel_path()
+    if reel_path is None:
         typer.echo("[ERROR] No reel selected.")
         typer.echo("   Run: uv run reels")
         raise typer.Exit(1)
-    reel_path = Path(CURRENT_REEL_FILE.read_text().strip())
     if not reel_path.exists():
         typer.echo(f"[ERROR] Reel not found: {reel_path}")
         raise typer.Exit(1)
@@ -1372,8 +1736,8 @@ def _get_reel_or_exit() -> Path:
 
 def run_init():
     """uv run init — Create provenance metadata."""
-    from dotenv import load_dotenv
-    load_dotenv()
+    from src.pipeline import init as pipeline_init
+    _load_env()
     
     reel_path = _get_reel_or_exit()
     typer.echo(f"[Reel] {reel_path.name}")
@@ -1384,8 +1748,8 @@ def run_init():
 
 def run_plan():
     """uv run plan — AI generates script structure."""
-    from dotenv import load_dotenv
-    load_dotenv()
+    from src.pipeline import generate_plan
+    _load_env()
     
     reel_path = _get_reel_or_exit()
     typer.echo(f"[Reel] {reel_path.name}")
@@ -1396,8 +1760,8 @@ def run_plan():
 
 def run_visual_plan():
     """uv run visual_plan — AI creates image/motion prompts."""
-    from dotenv import load_dotenv
-    load_dotenv()
+    from src.pipeline.visual_plan import generate_visual_plan
+    _load_env()
     
     reel_path = _get_reel_or_exit()
     typer.echo(f"[Reel] {reel_path.name}")
@@ -1408,8 +1772,8 @@ def run_visual_plan():
 
 def run_seed_images():
     """uv run seed-images — AI generates images from prompts."""
-    from dotenv import load_dotenv
-    load_dotenv()
+    from src.pipeline.assets import generate_assets
+    _load_env()
     
     reel_path = _get_reel_or_exit()
     typer.echo(f"[Reel] {reel_path.name}")
@@ -1421,8 +1785,8 @@ def run_seed_images():
 
 def run_vidprompt():
     """uv run vidprompt — AI refines motion prompts."""
-    from dotenv import load_dotenv
-    load_dotenv()
+    from src.pipeline.vidprompt import generate_video_prompts
+    _load_env()
     
     reel_path = _get_reel_or_exit()
     typer.echo(f"[Reel] {reel_path.name}")
@@ -1433,8 +1797,8 @@ def run_vidprompt():
 
 def run_videos():
     """uv run videos — AI generates video clips."""
-    from dotenv import load_dotenv
-    load_dotenv()
+    from src.pipeline.videos import generate_videos
+    _load_env()
     
     reel_path = _get_reel_or_exit()
     typer.echo(f"[Reel] {reel_path.name}")
@@ -1446,8 +1810,8 @@ def run_videos():
 
 def run_subsegments():
     """uv run subsegments — Assemble 10s video clips."""
-    from dotenv import load_dotenv
-    load_dotenv()
+    from src.pipeline import generate_subsegments
+    _load_env()
     
     reel_path = _get_reel_or_exit()
     typer.echo(f"[Reel] {reel_path.name}")
@@ -1458,8 +1822,8 @@ def run_subsegments():
 
 def run_voice():
     """uv run voice — Generate voiceover audio."""
-    from dotenv import load_dotenv
-    load_dotenv()
+    from src.pipeline import generate_voice
+    _load_env()
     
     reel_path = _get_reel_or_exit()
     typer.echo(f"[Reel] {reel_path.name}")
@@ -1470,8 +1834,8 @@ def run_voice():
 
 def run_captions():
     """uv run captions — Create SRT subtitles."""
-    from dotenv import load_dotenv
-    load_dotenv()
+    from src.pipeline import generate_captions_srt
+    _load_env()
     
     reel_path = _get_reel_or_exit()
     typer.echo(f"[Reel] {reel_path.name}")
@@ -1482,8 +1846,8 @@ def run_captions():
 
 def run_charts():
     """uv run charts — Render animated charts."""
-    from dotenv import load_dotenv
-    load_dotenv()
+    from src.pipeline import render_charts
+    _load_env()
     
     reel_path = _get_reel_or_exit()
     typer.echo(f"[Reel] {reel_path.name}")
@@ -1497,8 +1861,8 @@ def run_charts():
 
 def run_kit():
     """uv run kit — Generate thumbnail, guides, quality gate."""
-    from dotenv import load_dotenv
-    load_dotenv()
+    from src.pipeline import generate_kit
+    _load_env()
     
     reel_path = _get_reel_or_exit()
     typer.echo(f"[Reel] {reel_path.name}")
@@ -1511,8 +1875,7 @@ def run_kit():
 
 def run_all():
     """uv run run-all — Run all pipeline stages."""
-    from dotenv import load_dotenv
-    load_dotenv()
+    _load_env()
     
     reel_path = _get_reel_or_exit()
     typer.echo(f"[Reel] {reel_path.name}")
@@ -5,6 +5,7 @@ Edit the dictionaries below to switch models across the pipeline.
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 
@@ -62,9 +63,12 @@ MEDIA_API_KEY_ENV_VARS: dict[str, tuple[str, ...]] = {
 }
 
 
+@lru_cache(maxsize=None)
 def get_llm_api_key(provider: str) -> str:
     """Return the API key for an LLM provider from the environment.
 
+    Cached once found; a missing key raises and is looked up again next call.
+
     Raises:
         ValueError: unknown provider
         RuntimeError: key missing
@@ -83,9 +87,12 @@ def get_llm_api_key(provider: str) -> str:
     )
 
 
+@lru_cache(maxsize=None)
 def get_media_api_key(provider: str) -> str:
     """Return the API key for a media generation provider from the environment.
 
+    Cached once found; a missing key raises and is looked up again next call.
+
     Raises:
         ValueError: unknown provider
         RuntimeError: key missing
@@ -266,12 +273,14 @@ def get_model(provider: str, stage: Optional[str] = None) -> str:
         Model name string
     """
     # Check for stage-specific override first
-    if stage and stage in STAGE_MODELS and STAGE_MODELS[stage]:
-        return STAGE_MODELS[stage]
+    override = STAGE_MODELS.get(stage) if stage else None
+    if override:
+        return override
     
     # Fall back to provider default
-    if provider in MODELS:
-        return MODELS[provider]["default"]
+    models = MODELS.get(provider)
+    if models is not None:
+        return models["default"]
 
     raise ValueError(
         f"Unknown LLM provider: {provider}. Expected one of: {', '.join(sorted(MODELS.keys()))}"
@@ -298,50 +307,55 @@ def get_model_config(provider: str, stage: Optional[str] = None) -> ModelConfig:
 
 def get_image_model(provider: str) -> str:
     """Get image generation model for a provider."""
-    if provider not in IMAGE_MODELS:
+    models = IMAGE_MODELS.get(provider)
+    if models is None:
         raise ValueError(
             f"Unknown image provider: {provider}. Expected one of: {', '.join(sorted(IMAGE_MODELS.keys()))}"
         )
-    return IMAGE_MODELS[provider]["default"]
+    return models["default"]
 
 
 def get_video_model(provider: str) -> str:
     """Get video generation model for a provider."""
-    if provider not in VIDEO_MODELS:
+    models = VIDEO_MODELS.get(provider)
+    if models is None:
         raise ValueError(
             f"Unknown video provider: {provider}. Expected one of: {', '.join(sorted(VIDEO_MODELS.keys()))}"
         )
-    return VIDEO_MODELS[provider]["default"]
+    return models["default"]
 
 
 def get_audio_voice_model(provider: str = "elevenlabs") -> str:
     """Get audio (TTS) model ID for a provider."""
-    if provider not in AUDIO_MODELS or "voice_model" not in AUDIO_MODELS[provider]:
+    model = AUDIO_MODELS.get(provider, {}).get("voice_model")
+    if model is None:
         raise ValueError(
             f"Unknown/unsupported audio provider for voice model: {provider}. "
             f"Expected one of: {', '.join(sorted(AUDIO_MODELS.keys()))}"
         )
-    return AUDIO_MODELS[provider]["voice_model"]
+    return model
 
 
 def get_audio_sfx_model(provider: str = "elevenlabs") -> str:
     """Get audio (SFX) model ID for a provider."""
-    if provider not in AUDIO_MODELS or "sfx_model" not in AUDIO_MODELS[provider]:
+    model = AUDIO_MODELS.get(provider, {}).get("sfx_model")
+    if model is None:
         raise ValueError(
             f"Unknown/unsupported audio provider for sfx model: {provider}. "
             f"Expected one of: {', '.join(sorted(AUDIO_MODELS.keys()))}"
         )
-    return AUDIO_MODELS[provider]["sfx_model"]
+    return model
 
 
 def get_default_voice_id(provider: str = "elevenlabs") -> str:
     """Get default voice ID for a provider."""
-    if provider not in AUDIO_MODELS or "default_voice_id" not in AUDIO_MODELS[provider]:
+    voice_id = AUDIO_MODELS.get(provider, {}).get("default_voice_id")
+    if voice_id is None:
         raise ValueError(
             f"Unknown/unsupported audio provider for voice id: {provider}. "
             f"Expected one of: {', '.join(sorted(AUDIO_MODELS.keys()))}"
         )
-    return AUDIO_MODELS[provider]["default_voice_id"]
+    return voice_id
 
 
 def get_default_provider(stage: str) -> str:
@@ -1,12 +1,33 @@
 """Manifest model - The render payload sent to Remotion."""
 
 from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import Optional
 
 from .segment import Segment
 
-
-@dataclass
+# Remotion's camelCase keys, paired position-wise with the ManifestSegment fields
+_SEGMENT_KEYS = (
+    "id",
+    "startFrame",
+    "durationFrames",
+    "videoPath",
+    "audioPath",
+    "text",
+    "subtitleWords",
+)
+_segment_values = attrgetter(
+    "id",
+    "start_frame",
+    "duration_frames",
+    "video_path",
+    "audio_path",
+    "text",
+    "subtitle_words",
+)
+
+
+@dataclass(slots=True)
 class ManifestSegment:
     """Segment data formatted for Remotion timeline."""
 
@@ -19,7 +40,7 @@ class ManifestSegment:
     subtitle_words: list[dict]  # [{word, start_frame, end_frame}]
 
 
-@dataclass
+@dataclass(slots=True)
 class Manifest:
     """Complete render manifest for Remotion."""
 
@@ -79,16 +100,7 @@ class Manifest:
             "height": self.height,
             "totalFrames": self.total_frames,
             "segments": [
-                {
-                    "id": s.id,
-                    "startFrame": s.start_frame,
-                    "durationFrames": s.duration_frames,
-                    "videoPath": s.video_path,
-                    "audioPath": s.audio_path,
-                    "text": s.text,
-                    "subtitleWords": s.subtitle_words,
-                }
-                for s in self.segments
+                dict(zip(_SEGMENT_KEYS, _segment_values(s))) for s in self.segments
             ],
             "musicPath": self.music_path,
             "musicVolume": self.music_volume,
@@ -1,15 +1,45 @@
 """Objective model - Parses inputs/seed.md and inputs/reel.yaml into a unified config."""
 
+import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Literal, Optional
+from types import MappingProxyType
+from typing import Any, Literal, Optional
 
 import yaml
 
 from src.utils.paths import reel_yaml_path, seed_path
 
+# seed.md section headings ("# Hook") and "- item" list lines
+_SEED_SECTION_RE = re.compile(r"^# (.*)$", re.MULTILINE)
+_SEED_LIST_ITEM_RE = re.compile(r"^[^\S\n]*- [^\S\n]*(\S.*?)[^\S\n]*$", re.MULTILINE)
 
-@dataclass
+# libyaml's C loader when PyYAML was built with it; same safe semantics either way
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=256)
+def _parse_reel_yaml(path_str: str, mtime_ns: int) -> Any:
+    """Parse a reel.yaml file. Cached per (path, mtime) so edits are picked up."""
+    with open(path_str, "rb") as f:
+        data = yaml.load(f.read(), Loader=_YAML_LOADER)
+    # Shared between callers via the cache, so hand out a read-only view
+    return MappingProxyType(data) if isinstance(data, dict) else data
+
+
+def _load_reel_yaml(path: Path) -> Any:
+    """Load a reel.yaml, reusing the parsed result while the file is unchanged."""
+    return _parse_reel_yaml(str(path), path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=256)
+def _parse_seed_file(path_str: str, mtime_ns: int) -> MappingProxyType:
+    """Parse a seed.md file. Cached per (path, mtime) like reel.yaml."""
+    return MappingProxyType(Objective._parse_seed(Path(path_str)))
+
+
+@dataclass(slots=True)
 class Objective:
     """Represents the complete reel objective from seed + config."""
 
@@ -42,12 +72,14 @@ class Objective:
         if not yaml_path.exists():
             raise FileNotFoundError(f"Config not found: {yaml_path}")
 
-        with open(yaml_path, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
+        config = _load_reel_yaml(yaml_path)
 
         # Load seed markdown
         s_path = seed_path(reel_path)
-        seed_data = cls._parse_seed(s_path) if s_path.exists() else {}
+        try:
+            seed_data = _parse_seed_file(str(s_path), s_path.stat().st_mtime_ns)
+        except FileNotFoundError:
+            seed_data = {}
 
         return cls(
             title=config.get("title", "Untitled"),
@@ -61,7 +93,7 @@ class Objective:
             hook=seed_data.get("hook", ""),
             core_insight=seed_data.get("core_insight", ""),
             visual_vibe=seed_data.get("visual_vibe", ""),
-            data_sources=seed_data.get("data_sources", []),
+            data_sources=list(seed_data.get("data_sources", [])),
             reel_path=reel_path,
         )
 
@@ -71,30 +103,17 @@ class Objective:
         with open(seed_path, "r", encoding="utf-8") as f:
             content = f.read()
 
-        sections = {}
-        current_section = None
-        current_content = []
-
-        for line in content.split("\n"):
-            if line.startswith("# "):
-                if current_section:
-                    sections[current_section] = "\n".join(current_content).strip()
-                current_section = line[2:].lower().replace(" ", "_")
-                current_content = []
-            else:
-                current_content.append(line)
-
-        if current_section:
-            sections[current_section] = "\n".join(current_content).strip()
+        # [preamble, name1, body1, name2, body2, ...]
+        parts = _SEED_SECTION_RE.split(content)
+        sections = {
+            name.lower().replace(" ", "_"): body.strip()
+            for name, body in zip(parts[1::2], parts[2::2])
+            if name  # a bare "# " line ends the previous section but starts none
+        }
 
         # Parse data sources list
         if "data_sources" in sections:
-            sources = []
-            for line in sections["data_sources"].split("\n"):
-                line = line.strip()
-                if line.startswith("- "):
-                    sources.append(line[2:].strip())
-            sections["data_sources"] = sources
+            sections["data_sources"] = _SEED_LIST_ITEM_RE.findall(sections["data_sources"])
 
         return sections
 
@@ -1,7 +1,5 @@
 """Arcanomy Motion - CLI Entry Point."""
 
-import typer
-
 from src.commands import app
 
 if __name__ == "__main__":
@@ -6,12 +6,14 @@ to create seed images for video generation.
 
 from __future__ import annotations
 
+import importlib.util
 import json
 import os
-import subprocess
-import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from types import ModuleType
 from typing import Any
 
 from src.config import get_default_provider, get_image_model
@@ -28,6 +30,12 @@ logger = get_logger()
 # Path to the CLI script
 SCRIPTS_DIR = Path(__file__).parent.parent.parent / "scripts"
 
+# Overrides how many assets are generated at once
+ASSET_CONCURRENCY_ENV = "ARCANOMY_ASSET_CONCURRENCY"
+DEFAULT_ASSET_CONCURRENCY = 8
+# Deadline per generation, enforced by the provider calls' own request timeouts
+ASSET_TIMEOUT_SECONDS = 300
+
 
 def generate_assets(
     reel_path: Path,
@@ -35,6 +43,7 @@ def generate_assets(
     provider: str | None = None,
     dry_run: bool = False,
     force: bool = False,
+    max_workers: int | None = None,
 ) -> list[dict]:
     """Generate images from the visual plan prompts.
 
@@ -43,12 +52,15 @@ def generate_assets(
         provider: Image generation provider (kie, gemini, openai)
         dry_run: If True, only save prompts without calling API
         force: Regenerate even if images exist
+        max_workers: Concurrent generations (default: $ARCANOMY_ASSET_CONCURRENCY or 8)
 
     Returns:
         List of generation results
     """
     reel_path = Path(reel_path)
     provider = provider or get_default_provider("assets")
+    if max_workers is None:
+        max_workers = _asset_concurrency_from_env()
 
     # Load the visual plan
     vp_path = visual_plan_path(reel_path)
@@ -58,8 +70,8 @@ def generate_assets(
             f"Expected: {vp_path}"
         )
 
-    with open(vp_path, "r", encoding="utf-8") as f:
-        visual_plan = json.load(f)
+    # json.loads detects UTF-8 bytes itself, skipping the text-mode wrapper
+    visual_plan = json.loads(vp_path.read_bytes())
 
     global_atmosphere = visual_plan.get("global_atmosphere", "")
     assets = visual_plan.get("assets", [])
@@ -98,26 +110,29 @@ def generate_assets(
     if dry_run:
         logger.info("DRY RUN - prompts will be saved, no API calls")
 
-    # Process each asset
-    for i, asset in enumerate(assets, 1):
+    # Skips and dry runs are resolved up front; only real generations go to the pool
+    results: list[dict | None] = [None] * len(assets)
+    jobs: list[tuple[int, str, str, str]] = []
+    reel_dir = str(reel_path)
+    for i, asset in enumerate(assets):
         asset_id = asset.get("id", "unknown")
         image_prompt = asset.get("image_prompt", "")
         suggested_filename = asset.get("suggested_filename", f"{asset_id}.png")
         output_path = images_dir / suggested_filename
+        output_file = str(output_path)
 
         # Combine prompts
         full_prompt = f"{global_atmosphere}\n\n{image_prompt}"
 
-        logger.info(f"[{i}/{len(assets)}] {asset_id}")
-
         # Check if image already exists
         if output_path.exists() and not force:
+            logger.info(f"[{i + 1}/{len(assets)}] {asset_id}")
             logger.info(f"   [SKIP] Already exists")
-            execution_log["assets"].append({
+            results[i] = {
                 "id": asset_id,
                 "status": "exists",
-                "path": str(output_path.relative_to(reel_path)),
-            })
+                "path": os.path.relpath(output_file, reel_dir),
+            }
             execution_log["skipped"] += 1
             continue
 
@@ -126,74 +141,53 @@ def generate_assets(
         prompt_file.write_text(full_prompt, encoding="utf-8")
 
         if dry_run:
+            logger.info(f"[{i + 1}/{len(assets)}] {asset_id}")
             logger.info(f"   [DRY] Prompt saved")
-            execution_log["assets"].append({
+            results[i] = {
                 "id": asset_id,
                 "status": "dry_run",
-                "prompt_file": str(prompt_file.relative_to(reel_path)),
-            })
+                "prompt_file": os.path.relpath(prompt_file, reel_dir),
+            }
             continue
 
-        # Call the CLI script
-        try:
-            cmd = [
-                sys.executable,
-                str(cli_script),
-                "--prompt", full_prompt,
-                "--output", str(output_path),
-                "--provider", provider,
-            ]
-
-            env = os.environ.copy()
-            env["PYTHONIOENCODING"] = "utf-8"
-
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300,  # 5 minute timeout
-                encoding="utf-8",
-                env=env,
-            )
-
-            if result.returncode == 0:
-                logger.info(f"   [OK] Generated")
-                execution_log["assets"].append({
-                    "id": asset_id,
-                    "status": "success",
-                    "path": str(output_path.relative_to(reel_path)),
-                })
-                execution_log["successful"] += 1
-            else:
-                error = result.stderr[:500] if result.stderr else "Unknown error"
-                logger.error(f"   [FAIL] {error[:100]}")
-                execution_log["assets"].append({
-                    "id": asset_id,
-                    "status": "failed",
-                    "error": error,
-                })
-                execution_log["failures"].append(asset_id)
+        jobs.append((i, asset_id, full_prompt, output_file))
+
+    if jobs:
+        generator = _load_asset_generator(cli_script)
+        workers = max(1, min(max_workers, len(jobs)))
+        # Provider calls are independent and I/O-bound, so overlap them
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(
+                    _generate_one,
+                    generator,
+                    asset_id,
+                    full_prompt,
+                    output_file,
+                    provider=provider,
+                    reel_dir=reel_dir,
+                ): i
+                for i, asset_id, full_prompt, output_file in jobs
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                entry = future.result()
+                results[futures[future]] = entry
+                logger.info(f"[{done}/{len(jobs)}] {entry['id']}")
+                if entry["status"] == "success":
+                    logger.info(f"   [OK] Generated")
+                    execution_log["successful"] += 1
+                    continue
+                if entry["status"] == "failed":
+                    logger.error(f"   [FAIL] {entry['error'][:100]}")
+                elif entry["status"] == "timeout":
+                    logger.error(f"   [TIMEOUT] {entry['error'][:100]}")
+                else:
+                    logger.error(f"   [ERROR] {entry['error']}")
+                execution_log["failures"].append(entry["id"])
                 execution_log["failed"] += 1
 
-        except subprocess.TimeoutExpired:
-            logger.error(f"   [TIMEOUT] Timed out after 300s")
-            execution_log["assets"].append({
-                "id": asset_id,
-                "status": "timeout",
-                "error": "Generation timed out after 300 seconds",
-            })
-            execution_log["failures"].append(asset_id)
-            execution_log["failed"] += 1
-
-        except Exception as e:
-            logger.error(f"   [ERROR] {e}")
-            execution_log["assets"].append({
-                "id": asset_id,
-                "status": "error",
-                "error": str(e),
-            })
-            execution_log["failures"].append(asset_id)
-            execution_log["failed"] += 1
+    # Keep the log in visual-plan order regardless of completion order
+    execution_log["assets"] = [entry for entry in results if entry is not None]
 
     # Summary
     logger.info(f"Generation complete: {execution_log['successful']} successful, "
@@ -202,7 +196,71 @@ def generate_assets(
     # Save output log
     output_json = json_path(reel_path, "asset_generation.output.json")
     output_json.parent.mkdir(parents=True, exist_ok=True)
-    output_json.write_text(json.dumps(execution_log, indent=2), encoding="utf-8")
+    with output_json.open("w", encoding="utf-8") as f:
+        json.dump(execution_log, f, indent=2)
 
     return execution_log["assets"]
 
+
+def _asset_concurrency_from_env() -> int:
+    """Read $ARCANOMY_ASSET_CONCURRENCY, falling back to the default if unset or invalid."""
+    value = os.environ.get(ASSET_CONCURRENCY_ENV)
+    if value is None:
+        return DEFAULT_ASSET_CONCURRENCY
+    try:
+        workers = int(value)
+    except ValueError:
+        workers = 0
+    if workers < 1:
+        logger.warning(
+            f"Ignoring {ASSET_CONCURRENCY_ENV}={value!r} (expected a positive integer), "
+            f"using {DEFAULT_ASSET_CONCURRENCY}"
+        )
+        return DEFAULT_ASSET_CONCURRENCY
+    return workers
+
+
+@lru_cache(maxsize=None)
+def _load_asset_generator(script: Path) -> ModuleType:
+    """Import the generate_asset CLI script as a module, once per process.
+
+    Calling generate_asset() in-process avoids an interpreter start and
+    re-import of the provider SDKs for every asset.
+    """
+    spec = importlib.util.spec_from_file_location("_arcanomy_generate_asset", script)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _generate_one(
+    generator: ModuleType,
+    asset_id: str,
+    full_prompt: str,
+    output_file: str,
+    *,
+    provider: str,
+    reel_dir: str,
+) -> dict:
+    """Generate one image and return its log entry."""
+    try:
+        generator.generate_asset(
+            full_prompt,
+            output_file,
+            provider,
+            # Logged per line with the asset id so concurrent output stays readable
+            log=lambda line: logger.info(f"[{asset_id}] {line.strip()}"),
+            tick=lambda line: logger.debug(f"[{asset_id}] {line.strip()}"),
+            timeout=ASSET_TIMEOUT_SECONDS,
+        )
+    except generator.AssetTimeoutError as e:
+        return {"id": asset_id, "status": "timeout", "error": str(e)[:500]}
+    except generator.AssetGenerationError as e:
+        return {"id": asset_id, "status": "failed", "error": str(e)[:500]}
+    except Exception as e:
+        return {"id": asset_id, "status": "error", "error": str(e)}
+    return {
+        "id": asset_id,
+        "status": "success",
+        "path": os.path.relpath(output_file, reel_dir),
+    }
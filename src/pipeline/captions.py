@@ -9,11 +9,15 @@ Canonical output:
 
 from __future__ import annotations
 
+import json
 import math
+import os
 import re
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from itertools import accumulate
 from pathlib import Path
 
 from src.utils.paths import (
@@ -25,6 +29,11 @@ from src.utils.paths import (
 from src.pipeline.visuals import probe_duration_seconds, validate_duration
 
 
+# ffmpeg silencedetect log values and caption words
+_SILENCE_EVENT_RE = re.compile(rb"silence_(start|end):\s*([0-9.]+)")
+_WORD_RE = re.compile(r"\S+")
+
+
 def _format_srt_timestamp(seconds: float) -> str:
     if seconds < 0:
         seconds = 0
@@ -75,28 +84,52 @@ def _silence_segments(path: Path, *, noise_db: float = -35.0, min_silence: float
         "null",
         "-",
     ]
-    proc = subprocess.run(cmd, capture_output=True, text=True)
-    text = proc.stderr or ""
-    events: list[tuple[str, float]] = []
-    for line in text.splitlines():
-        line = line.strip()
-        if "silence_start:" in line:
-            m = re.search(r"silence_start:\s*([0-9.]+)", line)
-            if m:
-                events.append(("start", float(m.group(1))))
-        elif "silence_end:" in line:
-            m = re.search(r"silence_end:\s*([0-9.]+)", line)
-            if m:
-                events.append(("end", float(m.group(1))))
+    proc = subprocess.run(cmd, capture_output=True)
+    # One scan over the raw log; float() accepts the ASCII digits as bytes
+    return [
+        (m.group(1).decode("ascii"), float(m.group(2)))
+        for m in _SILENCE_EVENT_RE.finditer(proc.stderr or b"")
+    ]
+
+
+def _cached_silence_segments(
+    path: Path,
+    cache_dir: Path,
+    *,
+    noise_db: float = -35.0,
+    min_silence: float = 0.2,
+) -> list[tuple[str, float]]:
+    """_silence_segments, reusing the result stored in `cache_dir` while the WAV is unchanged.
+
+    Saves an ffmpeg run per subsegment when captions are regenerated.
+    """
+    st = path.stat()
+    key = f"{st.st_mtime_ns}:{st.st_size}:{noise_db}:{min_silence}"
+    cache_file = cache_dir / f"{path.name}.json"
+    try:
+        cached = json.loads(cache_file.read_bytes())
+        if cached.get("key") == key:
+            return [(kind, t) for kind, t in cached["events"]]
+    except (FileNotFoundError, ValueError, KeyError, TypeError):
+        pass
+
+    events = _silence_segments(path, noise_db=noise_db, min_silence=min_silence)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    cache_file.write_text(json.dumps({"key": key, "events": events}), encoding="utf-8")
     return events
 
 
-def _speech_window(path: Path, *, total_seconds: float = 10.0) -> tuple[float, float]:
+def _speech_window(
+    path: Path,
+    *,
+    total_seconds: float = 10.0,
+    cache_dir: Path | None = None,
+) -> tuple[float, float]:
     """Estimate speech start/end from silencedetect.
 
     If no useful events, returns a conservative default window.
     """
-    events = _silence_segments(path)
+    events = _cached_silence_segments(path, cache_dir) if cache_dir else _silence_segments(path)
     # Defaults
     start = 0.1
     end = total_seconds - 0.1
@@ -125,7 +158,7 @@ def _speech_window(path: Path, *, total_seconds: float = 10.0) -> tuple[float, f
 
 def _split_caption_lines(text: str, *, max_words: int = 9, max_chars: int = 42) -> list[str]:
     """Split into multiple SRT entries (each a single line) deterministically."""
-    words = re.findall(r"\S+", text.strip())
+    words = _WORD_RE.findall(text.strip())
     if not words:
         return []
 
@@ -168,27 +201,33 @@ def generate_captions_srt(
     if not plan_file.exists():
         raise FileNotFoundError(f"Missing plan: {plan_file}. Run 'plan' stage first.")
 
-    import json
-
     plan = json.loads(plan_file.read_text(encoding="utf-8"))
     subsegments = plan.get("subsegments") or []
     voice_dir = pipeline_voice_dir(reel_path)
+    silence_cache_dir = reel_path / ".cache" / "silence"
 
-    srt_entries: list[tuple[float, float, str]] = []
-    idx_counter = 1
-
-    for idx, ss in enumerate(subsegments):
-        sid = ss["subsegment_id"]
-        text = (ss.get("voice") or {}).get("text") or ""
-        wav = voice_dir / f"{sid}.wav"
+    wavs = [voice_dir / f"{ss['subsegment_id']}.wav" for ss in subsegments]
+    for wav in wavs:
         if not wav.exists():
             raise FileNotFoundError(f"Missing voice WAV for captions alignment: {wav}")
 
+    # Each WAV costs an ffprobe + an ffmpeg run; they are independent, so run
+    # them side by side and walk the results in subsegment order below.
+    def analyze(wav: Path) -> tuple[float, tuple[float, float]]:
         dur = probe_duration_seconds(wav)
+        return dur, _speech_window(wav, total_seconds=10.0, cache_dir=silence_cache_dir)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(len(wavs), os.cpu_count() or 1))) as pool:
+        analyses = list(pool.map(analyze, wavs))
+
+    srt_entries: list[tuple[float, float, str]] = []
+    idx_counter = 1
+
+    for idx, (ss, (dur, (local_start, local_end))) in enumerate(zip(subsegments, analyses)):
+        text = (ss.get("voice") or {}).get("text") or ""
         validate_duration(duration_seconds=dur, target_seconds=10.0, fps=fps, tolerance_frames=1)
 
         # Local window within the 10s block
-        local_start, local_end = _speech_window(wav, total_seconds=10.0)
         window = max(0.2, local_end - local_start)
 
         # Split into line-level entries
@@ -200,13 +239,9 @@ def generate_captions_srt(
         total_w = sum(weights)
         offsets = idx * 10.0
 
-        cursor = local_start
-        for line, w in zip(lines, weights):
-            span = window * (w / total_w)
-            start = cursor
-            end = cursor + span
-            cursor = end
-
+        # Line boundaries: running sum of each line's share of the speech window
+        bounds = list(accumulate((window * (w / total_w) for w in weights), initial=local_start))
+        for line, start, end in zip(lines, bounds, bounds[1:]):
             # Clamp within this subsegment
             start = max(0.0, min(10.0, start))
             end = max(start + (1.0 / fps), min(10.0, end))
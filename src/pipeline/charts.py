@@ -22,8 +22,10 @@ Canonical approach (aligned with docs/charts):
 from __future__ import annotations
 
 import json
+import os
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -41,20 +43,20 @@ ANIM_FRAMES_FOR_10S = TARGET_FRAMES - HOLD_FRAMES_DEFAULT  # 270
 
 def _normalize_chart_props(props: dict[str, Any]) -> dict[str, Any]:
     """Mutate chart props to enforce canonical 10s render + green-screen background."""
-    out = json.loads(json.dumps(props))  # deep copy deterministically
+    # Only background and animation are mutated, so copy just those levels;
+    # everything else is shared with the plan and serialized untouched.
+    out = dict(props)
 
     # Green-screen background (docs/charts)
     bg = out.get("background")
-    if not isinstance(bg, dict):
-        bg = {}
-        out["background"] = bg
+    bg = dict(bg) if isinstance(bg, dict) else {}
+    out["background"] = bg
     bg["color"] = "#00FF00"
 
     # Animation normalization
     anim = out.get("animation")
-    if not isinstance(anim, dict):
-        anim = {}
-        out["animation"] = anim
+    anim = dict(anim) if isinstance(anim, dict) else {}
+    out["animation"] = anim
     anim["duration"] = int(ANIM_FRAMES_FOR_10S)
     anim["style"] = "simultaneous"
     anim["staggerDelay"] = 0
@@ -71,25 +73,41 @@ def _normalize_chart_props(props: dict[str, Any]) -> dict[str, Any]:
     return out
 
 
-def probe_video_frame_count(path: Path) -> int:
-    """Count decoded video frames using ffprobe."""
-    if shutil.which("ffprobe") is None:
-        raise RuntimeError("ffprobe not found on PATH (required for frame validation).")
+def _ffprobe_frames(path: Path, *, decode: bool) -> int | None:
+    """Read the first video stream's frame count, or None if unreported."""
+    entry = "nb_read_frames" if decode else "nb_frames"
     cmd = [
         "ffprobe",
         "-v",
         "error",
         "-select_streams",
         "v:0",
-        "-count_frames",
+        *(["-count_frames"] if decode else []),
         "-show_entries",
-        "stream=nb_read_frames",
+        f"stream={entry}",
         "-of",
-        "default=noprint_wrappers=1:nokey=1",
+        "json",
         str(path),
     ]
-    out = subprocess.check_output(cmd).decode("utf-8", errors="replace").strip()
-    return int(out)
+    streams = json.loads(subprocess.check_output(cmd)).get("streams") or [{}]
+    value = str(streams[0].get(entry, ""))
+    return int(value) if value.isdigit() and int(value) > 0 else None
+
+
+def probe_video_frame_count(path: Path) -> int:
+    """Count video frames using ffprobe.
+
+    Uses the container-reported frame count when the muxer wrote one (a
+    metadata read) and falls back to decoding the stream otherwise.
+    """
+    if shutil.which("ffprobe") is None:
+        raise RuntimeError("ffprobe not found on PATH (required for frame validation).")
+    frames = _ffprobe_frames(path, decode=False)
+    if frames is None:
+        frames = _ffprobe_frames(path, decode=True)
+    if frames is None:
+        raise RuntimeError(f"ffprobe reported no frame count for {path}")
+    return frames
 
 
 def render_charts(
@@ -110,14 +128,15 @@ def render_charts(
     out_dir = charts_dir(reel_path)
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    rendered: list[Path] = []
+    # (props_path, mp4_path, needs_render) in plan order
+    jobs: list[tuple[Path, Path, bool]] = []
     for ss in subsegments:
         sid = ss.get("subsegment_id")
-        jobs = ss.get("charts") or []
-        if not sid or not isinstance(jobs, list):
+        chart_jobs = ss.get("charts") or []
+        if not sid or not isinstance(chart_jobs, list):
             continue
 
-        for job in jobs:
+        for job in chart_jobs:
             if not isinstance(job, dict):
                 continue
             chart_id = str(job.get("chart_id") or "chart")
@@ -133,22 +152,36 @@ def render_charts(
             write_json_immutable(props_path, norm, force=force)
 
             # Render (skip if exists unless force)
-            if mp4_path.exists() and not force:
-                frames = probe_video_frame_count(mp4_path)
-                # Accept ±1 frame per RFC
-                if abs(frames - TARGET_FRAMES) > 1:
-                    raise RuntimeError(f"Chart frame count out of tolerance: got {frames}, expected {TARGET_FRAMES}±1")
-                rendered.append(mp4_path)
-                continue
+            jobs.append((props_path, mp4_path, force or not mp4_path.exists()))
 
-            # Render exact 10.0s by clamping frames.
-            render_chart_from_json(props_path, output_path=mp4_path, frames="0-299")
-            frames = probe_video_frame_count(mp4_path)
-            if abs(frames - TARGET_FRAMES) > 1:
-                raise RuntimeError(f"Chart frame count out of tolerance: got {frames}, expected {TARGET_FRAMES}±1")
-            rendered.append(mp4_path)
+    if not jobs:
+        return []
 
-    return rendered
+    # Each render is an independent Remotion (Node) subprocess that is itself
+    # multi-threaded, so run about half as many renders as there are cores.
+    workers = max(1, min(len(jobs), (os.cpu_count() or 2) // 2))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(lambda job: _render_chart(*job), jobs))
+
+
+def _render_chart(props_path: Path, mp4_path: Path, needs_render: bool) -> Path:
+    """Render one chart if needed and validate its frame count."""
+    if needs_render:
+        # Per-chart Remotion props file so concurrent renders don't share one
+        remotion_props = mp4_path.with_name(f".{mp4_path.stem}.remotion_props.json")
+        try:
+            # Render exact 10.0s by clamping frames.
+            render_chart_from_json(
+                props_path, output_path=mp4_path, frames="0-299", props_file=remotion_props
+            )
+        finally:
+            remotion_props.unlink(missing_ok=True)
+
+    frames = probe_video_frame_count(mp4_path)
+    # Accept ±1 frame per RFC
+    if abs(frames - TARGET_FRAMES) > 1:
+        raise RuntimeError(f"Chart frame count out of tolerance: got {frames}, expected {TARGET_FRAMES}±1")
+    return mp4_path
 
 
 # Legacy alias
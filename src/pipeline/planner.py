@@ -11,8 +11,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Literal
 
-from src.config import get_default_provider
-from src.services import LLMService
+from src.config import get_default_provider, get_model
+from src.services import get_llm
 from src.utils.paths import (
     chart_json_path,
     claim_json_path,
@@ -21,7 +21,14 @@ from src.utils.paths import (
     provenance_path,
     seed_path,
 )
-from src.pipeline.provenance import build_provenance, RunContext, write_json_immutable
+from src.pipeline.provenance import (
+    build_provenance,
+    causal_key,
+    RunContext,
+    stable_json_dumps,
+    write_json_immutable,
+)
+from src.utils.fetch_cache import write_atomic
 from src.utils.logger import get_logger
 
 logger = get_logger()
@@ -31,6 +38,9 @@ AuditLevel = Literal["basic", "strict"]
 # Path to system prompt
 SYSTEM_PROMPT_PATH = Path(__file__).parent.parent / "prompts" / "plan_system.md"
 
+# Bump when prompt building or plan enrichment changes so cached plans are not reused
+PLAN_CACHE_VERSION = "v1"
+
 
 @dataclass(frozen=True)
 class ClaimInput:
@@ -282,7 +292,31 @@ def generate_plan(
         chart_props = _read_json(chart_file)
         logger.info(f"[Plan] Loaded chart.json ({chart_props.get('chartType', 'unknown')} chart)")
     
+    out = plan_path(reel_path)
+    cache_file = None
+
     if ai:
+        # Causal cache: same inputs + prompt + provider/model -> same plan, skip the LLM call
+        provider = ai_provider or get_default_provider("plan")
+        key = causal_key(
+            [claim_file, seed_file, chart_file, SYSTEM_PROMPT_PATH],
+            PLAN_CACHE_VERSION,
+            provider,
+            get_model(provider, "plan"),
+        )
+        cache_file = reel_path / ".cache" / "plan" / f"{key}.json"
+        cached = None
+        if not force and cache_file.exists():
+            try:
+                cached = _read_json(cache_file)
+            except (OSError, ValueError) as e:
+                logger.warning(f"[Plan] Ignoring unreadable plan cache entry: {e}")
+        if cached is not None:
+            logger.info("[Plan] Inputs unchanged, reusing cached plan")
+            # Restores a missing plan; a different plan on disk fails as usual
+            write_json_immutable(out, cached, force=False)
+            return out
+
         # Load system prompt
         system_prompt = _load_system_prompt()
         logger.info(f"[Plan] Using AI mode with system prompt")
@@ -290,9 +324,7 @@ def generate_plan(
         # Build user prompt
         user_prompt = _build_user_prompt(claim, seed_content, chart_props)
         
-        # Get LLM provider
-        provider = ai_provider or get_default_provider("plan")
-        llm = LLMService(provider=provider)
+        llm = get_llm(provider)
         
         logger.info(f"[Plan] Calling {provider} for plan generation...")
         
@@ -316,8 +348,10 @@ def generate_plan(
         plan = _generate_fallback_plan(claim, chart_props, reel_path)
     
     # Write plan
-    out = plan_path(reel_path)
     write_json_immutable(out, plan, force=force)
+    # Cache only a plan that made it to disk
+    if cache_file is not None:
+        write_atomic(cache_file, stable_json_dumps(plan).encode("utf-8"))
     return out
 
 
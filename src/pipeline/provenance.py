@@ -13,7 +13,7 @@ import sys
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, Iterable, Mapping
 
 
 def _sha256_bytes(data: bytes) -> str:
@@ -31,6 +31,21 @@ def sha256_file(path: Path) -> str:
     return h.hexdigest()
 
 
+def causal_key(inputs: Iterable[Path], *parts: str) -> str:
+    """Hash input file bytes plus extra parts (code version, provider, ...).
+
+    Missing inputs hash as absent, so creating one later changes the key.
+    """
+    h = hashlib.sha256()
+    for p in inputs:
+        p = Path(p)
+        digest = sha256_file(p) if p.exists() else "missing"
+        h.update(f"{p.name}:{digest}\n".encode("utf-8"))
+    for part in parts:
+        h.update(f"{part}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
 def stable_json_dumps(obj: Any) -> str:
     """Deterministic JSON encoding."""
     return json.dumps(obj, ensure_ascii=False, sort_keys=True, indent=2) + "\n"
@@ -12,7 +12,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 from src.config import get_default_provider
-from src.services import LLMService
+from src.services import get_llm
 from src.utils.logger import get_logger
 
 logger = get_logger()
@@ -235,7 +235,7 @@ def generate_script(
     if not provider:
         provider = get_default_provider("script")
     
-    llm = LLMService(provider=provider)
+    llm = get_llm(provider)
     data_context = _build_data_context(data)
     
     user_prompt = USER_PROMPT_TEMPLATE.format(
@@ -11,7 +11,7 @@ from pathlib import Path
 from typing import Any
 
 from src.config import get_default_provider
-from src.services import LLMService
+from src.services import get_llm
 from src.utils.paths import (
     images_composites_dir,
     video_prompts_path,
@@ -113,7 +113,7 @@ def _generate_with_ai(
 ) -> dict[str, Any]:
     """Generate refined video prompts using LLM."""
     provider = provider_override or get_default_provider("vidprompt")
-    llm = LLMService(provider=provider)
+    llm = get_llm(provider)
     system_prompt = _load_system_prompt()
 
     user_prompt = f"""# Video Prompt Refinement Request
@@ -16,7 +16,7 @@ from pathlib import Path
 from typing import Any
 
 from src.config import get_default_provider
-from src.services import LLMService
+from src.services import get_llm
 from src.utils.paths import (
     claim_json_path,
     plan_path,
@@ -218,7 +218,7 @@ def _generate_with_ai(
 ) -> dict[str, Any]:
     """Generate visual plan using LLM."""
     provider = provider_override or get_default_provider("visual_plan")
-    llm = LLMService(provider=provider)
+    llm = get_llm(provider)
     system_prompt = _load_system_prompt()
 
     # Filter out chart subsegments (LLM only generates image prompts)
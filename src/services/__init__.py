@@ -1,9 +1,10 @@
-from .llm import LLMService
+from .llm import LLMService, get_llm
 from .elevenlabs import ElevenLabsService
 from .remotion_cli import RemotionCLI
 from .blog_ingest import (
     BlogPost,
     fetch_featured_blogs,
+    fetch_blog_meta,
     fetch_blog_mdx,
     extract_seed_and_config,
     extract_seed_pipeline,
@@ -33,10 +34,12 @@ from .validator import (
 
 __all__ = [
     "LLMService",
+    "get_llm",
     "ElevenLabsService",
     "RemotionCLI",
     "BlogPost",
     "fetch_featured_blogs",
+    "fetch_blog_meta",
     "fetch_blog_mdx",
     "extract_seed_and_config",
     "extract_seed_pipeline",
@@ -1,11 +1,15 @@
 """Blog ingestion service for fetching and parsing Arcanomy blogs."""
 
-import httpx
+import json
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Optional
 
+import httpx
+
 from src.config import get_default_voice_id, SEED_EXTRACTION
-from src.services.llm import LLMService
+from src.services.llm import LLMService, get_llm
+from src.utils.fetch_cache import open_atomic, read_fresh, write_atomic
 from src.utils.logger import get_logger
 
 logger = get_logger()
@@ -13,6 +17,17 @@ logger = get_logger()
 CDN_BASE_URL = "https://cdn.arcanomydata.com/content/posts"
 FEATURED_INDEX_URL = f"{CDN_BASE_URL}/_indexes/featured.json"
 
+# Local cache for downloaded blog content (relative to the working directory,
+# like content/reels). Re-running ingest-blog within the TTL skips the CDN.
+CACHE_DIR = Path(".cache")
+MDX_CACHE_TTL_SECONDS = 3600
+# The featured index changes more often; list-blogs/ingest-blog --no-cache refresh it
+FEED_CACHE_TTL_SECONDS = 600
+
+# BlogPost fields the ingest pipeline reads (prompts, seed, claim). A post
+# manifest missing any of them is not used; the featured index is instead.
+MANIFEST_REQUIRED_FIELDS = ("slug", "title", "description", "section", "category", "tags")
+
 
 @dataclass
 class BlogPost:
@@ -48,18 +63,37 @@ class BlogPost:
         )
 
 
-def fetch_featured_blogs(limit: Optional[int] = None) -> list[BlogPost]:
+def _load_cached_json(cache_file: Optional[Path], ttl_seconds: float) -> Optional[dict]:
+    """Return the parsed cache entry, or None if missing, stale or corrupt."""
+    cached = read_fresh(cache_file, ttl_seconds)
+    if cached is None:
+        return None
+    try:
+        return json.loads(cached)
+    except ValueError:
+        return None
+
+
+def fetch_featured_blogs(limit: Optional[int] = None, *, use_cache: bool = True) -> list[BlogPost]:
     """Fetch the list of featured blogs from the CDN.
 
     Args:
         limit: Maximum number of blogs to return (most recent first)
+        use_cache: Reuse the full index if downloaded within FEED_CACHE_TTL_SECONDS.
+                   The cache is refreshed after every download either way.
 
     Returns:
         List of BlogPost objects sorted by published_date descending
     """
-    response = httpx.get(FEATURED_INDEX_URL, timeout=30.0)
-    response.raise_for_status()
-    data = response.json()
+    cache_file = CACHE_DIR / "featured.json"
+    data = _load_cached_json(cache_file, FEED_CACHE_TTL_SECONDS) if use_cache else None
+
+    if data is None:
+        response = httpx.get(FEATURED_INDEX_URL, timeout=30.0)
+        response.raise_for_status()
+        data = response.json()
+        # Cache the whole index, so any --limit can be served from it
+        write_atomic(cache_file, response.content)
 
     posts = [BlogPost.from_dict(p) for p in data.get("posts", [])]
 
@@ -72,19 +106,71 @@ def fetch_featured_blogs(limit: Optional[int] = None) -> list[BlogPost]:
     return posts
 
 
-def fetch_blog_mdx(identifier: str) -> str:
+def fetch_blog_meta(identifier: str, *, use_cache: bool = True) -> BlogPost:
+    """Fetch one post's metadata from its manifest.json, without the featured index.
+
+    Args:
+        identifier: The exact blog identifier
+        use_cache: Reuse a copy downloaded within MDX_CACHE_TTL_SECONDS.
+
+    Returns:
+        BlogPost for the identifier
+
+    Raises:
+        httpx.HTTPError: If there is no manifest for this identifier
+        KeyError: If the manifest lacks any of MANIFEST_REQUIRED_FIELDS
+    """
+    # Only plain identifiers map to a cache file (never a path outside CACHE_DIR)
+    cache_file = CACHE_DIR / "meta" / f"{identifier}.json" if Path(identifier).name == identifier else None
+    data = _load_cached_json(cache_file, MDX_CACHE_TTL_SECONDS) if use_cache else None
+
+    if data is None:
+        response = httpx.get(f"{CDN_BASE_URL}/{identifier}/manifest.json", timeout=30.0)
+        response.raise_for_status()
+        data = response.json()
+        if cache_file is not None:
+            write_atomic(cache_file, response.content)
+
+    missing = [name for name in MANIFEST_REQUIRED_FIELDS if name not in data]
+    if missing:
+        raise KeyError(f"manifest for {identifier} lacks {', '.join(missing)}")
+
+    # The identifier is the manifest's folder on the CDN, so it is authoritative
+    return BlogPost.from_dict({**data, "identifier": identifier})
+
+
+def fetch_blog_mdx(identifier: str, *, use_cache: bool = True) -> str:
     """Fetch the raw MDX content for a blog post.
 
     Args:
         identifier: The blog identifier (e.g., "2025-08-10-knowledge-the-psychology-of-money")
+        use_cache: Reuse a copy downloaded within MDX_CACHE_TTL_SECONDS.
+                   The cache is refreshed after every download either way.
 
     Returns:
         The raw MDX content as a string
     """
+    # Only plain identifiers map to a cache file (never a path outside CACHE_DIR)
+    cache_file = CACHE_DIR / "mdx" / f"{identifier}.mdx" if Path(identifier).name == identifier else None
+
+    cached = read_fresh(cache_file, MDX_CACHE_TTL_SECONDS) if use_cache else None
+    if cached is not None:
+        return cached.decode("utf-8")
+
     url = f"{CDN_BASE_URL}/{identifier}/content.mdx"
-    response = httpx.get(url, timeout=30.0)
-    response.raise_for_status()
-    return response.text
+    if cache_file is None:
+        response = httpx.get(url, timeout=30.0)
+        response.raise_for_status()
+        return response.text
+
+    # Stream the body straight into the cache, then swap it in, so an interrupted
+    # download never leaves a truncated copy behind for the next run to reuse
+    with httpx.stream("GET", url, timeout=30.0) as response:
+        response.raise_for_status()
+        with open_atomic(cache_file) as f:
+            for chunk in response.iter_bytes(64 * 1024):
+                f.write(chunk)
+    return cache_file.read_text(encoding="utf-8")
 
 
 # =============================================================================
@@ -210,6 +296,21 @@ Given key data points, generate a chart configuration that will be rendered to M
 Return ONLY valid JSON."""
 
 
+def warm_seed_pipeline_clients() -> None:
+    """Create the seed-pipeline LLM clients ahead of use.
+
+    Importing the provider SDKs and building their clients takes a while;
+    running this in a background thread overlaps it with fetching the blog.
+    Errors (e.g. a missing API key) are only logged at debug level and left
+    for the real call to report.
+    """
+    for provider in dict.fromkeys(SEED_EXTRACTION.values()):
+        try:
+            get_llm(provider)._get_client()
+        except Exception as e:
+            logger.debug(f"Could not warm {provider} client: {e}")
+
+
 def extract_seed_pipeline(
     mdx_content: str,
     blog: BlogPost,
@@ -255,7 +356,7 @@ def extract_seed_pipeline(
     # =========================================================================
     log(f"[Step 1/3] Extracting with {extractor_provider}...")
     
-    extractor = LLMService(provider=extractor_provider)
+    extractor = get_llm(extractor_provider)
     
     step1_prompt = f"""Extract the most compelling video hook from this blog.
 
@@ -277,7 +378,7 @@ Remember: Follow truth → mistake → fix structure. Pick one of the 5 allowed
     # =========================================================================
     log(f"[Step 2/3] Verifying with {verifier_provider}...")
     
-    verifier = LLMService(provider=verifier_provider)
+    verifier = get_llm(verifier_provider)
     
     step2_prompt = f"""Verify this extracted content against the original blog.
 
@@ -304,7 +405,7 @@ Check accuracy, verify any statistics, and ensure compliance with truth→mistak
     # =========================================================================
     log(f"[Step 3/3] Refining with {refiner_provider}...")
     
-    refiner = LLMService(provider=refiner_provider)
+    refiner = get_llm(refiner_provider)
     
     corrections_text = ""
     if corrections:
@@ -856,7 +957,7 @@ BLOG CONTENT:
             verifier_model = get_model(verifier_provider)
             log(f"[LLM] Verification: {verifier_provider} ({verifier_model})")
             
-            verifier_llm = LLMService(provider=verifier_provider)
+            verifier_llm = get_llm(verifier_provider)
             
             verified_points = _verify_data_points(
                 data_points=extracted_points,
@@ -126,12 +126,15 @@ class ChartRenderer:
         json_path: Path,
         output_path: Optional[Path] = None,
         frames: Optional[str] = None,
+        props_file: Optional[Path] = None,
     ) -> Path:
         """Render a chart from a JSON props file.
         
         Args:
             json_path: Path to JSON file containing chart props
             output_path: Where to save video. If None, saves next to JSON file.
+            props_file: Where to write the Remotion props (must be unique per
+                        concurrent render; defaults to remotion_props.json)
             
         Returns:
             Path to the rendered video file
@@ -187,6 +190,7 @@ class ChartRenderer:
             composition_id=composition_id,
             output_path=Path(output_path),
             props=props_dict,
+            props_file=props_file,
             frames=frames,
         )
 
@@ -220,6 +224,7 @@ def render_chart_from_json(
     output_path: Optional[Path] = None,
     remotion_dir: Optional[Path] = None,
     frames: Optional[str] = None,
+    props_file: Optional[Path] = None,
 ) -> Path:
     """Convenience function to render a chart from JSON file.
     
@@ -227,10 +232,13 @@ def render_chart_from_json(
         json_path: Path to JSON props file
         output_path: Where to save video (optional)
         remotion_dir: Optional Remotion project directory
+        props_file: Where to write the Remotion props (optional)
         
     Returns:
         Path to rendered video
     """
     renderer = ChartRenderer(remotion_dir)
-    return renderer.render_from_json(json_path, output_path, frames=frames)
+    return renderer.render_from_json(
+        json_path, output_path, frames=frames, props_file=props_file
+    )
 
@@ -1,6 +1,7 @@
 """LLM service wrapper for OpenAI, Anthropic, and Google Gemini."""
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Literal, Optional
 
 import typer
@@ -105,14 +106,15 @@ class LLMService:
             
             # Track token usage
             usage = response.usage
-            self.last_usage = TokenUsage(
+            token_usage = TokenUsage(
                 input_tokens=usage.prompt_tokens,
                 output_tokens=usage.completion_tokens,
                 total_tokens=usage.total_tokens,
                 model=model,
                 provider=self.provider,
             )
-            self.last_usage.print()
+            self.last_usage = token_usage
+            token_usage.print()
             
             return response.choices[0].message.content
 
@@ -127,14 +129,15 @@ class LLMService:
             
             # Track token usage
             usage = response.usage
-            self.last_usage = TokenUsage(
+            token_usage = TokenUsage(
                 input_tokens=usage.input_tokens,
                 output_tokens=usage.output_tokens,
                 total_tokens=usage.input_tokens + usage.output_tokens,
                 model=model,
                 provider=self.provider,
             )
-            self.last_usage.print()
+            self.last_usage = token_usage
+            token_usage.print()
             
             return response.content[0].text
 
@@ -152,14 +155,15 @@ class LLMService:
             # Gemini token counting (approximate from metadata if available)
             try:
                 usage_meta = response.usage_metadata
-                self.last_usage = TokenUsage(
+                token_usage = TokenUsage(
                     input_tokens=usage_meta.prompt_token_count,
                     output_tokens=usage_meta.candidates_token_count,
                     total_tokens=usage_meta.total_token_count,
                     model=target_model,
                     provider=self.provider,
                 )
-                self.last_usage.print()
+                self.last_usage = token_usage
+                token_usage.print()
             except Exception:
                 pass  # Gemini may not always return usage
             
@@ -198,3 +202,12 @@ class LLMService:
 
         return json.loads(response.strip())
 
+
+@lru_cache(maxsize=4)
+def get_llm(provider: Provider = "openai") -> LLMService:
+    """Return a shared LLMService for `provider`.
+
+    Reusing one instance per provider keeps its client (and connection pool)
+    alive across stages run in the same process.
+    """
+    return LLMService(provider=provider)
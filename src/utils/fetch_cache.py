@@ -0,0 +1,54 @@
+"""On-disk cache helpers for downloaded CDN content.
+
+Entries are plain files whose mtime is their download time; a TTL check is
+one stat. Writes go through a temporary file so readers never see a partial
+entry.
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional
+
+
+def read_fresh(path: Optional[Path], ttl_seconds: float) -> Optional[bytes]:
+    """Return the cached bytes at `path` if written within `ttl_seconds`.
+
+    Args:
+        path: Cache file (None means "not cacheable", always a miss)
+        ttl_seconds: Maximum age of the entry
+
+    Returns:
+        File contents, or None on a miss or stale entry
+    """
+    if path is None:
+        return None
+    try:
+        if time.time() - path.stat().st_mtime >= ttl_seconds:
+            return None
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+@contextmanager
+def open_atomic(path: Path) -> Iterator[BinaryIO]:
+    """Open a binary file that replaces `path` only once fully written.
+
+    If the block raises, the partial file is removed and `path` is untouched.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    part_file = path.with_name(f"{path.name}.{os.getpid()}.part")
+    try:
+        with open(part_file, "wb") as f:
+            yield f
+        os.replace(part_file, path)
+    finally:
+        part_file.unlink(missing_ok=True)
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write `data` to `path` via a temporary file."""
+    with open_atomic(path) as f:
+        f.write(data)
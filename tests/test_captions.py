@@ -0,0 +1,67 @@
+"""Tests for caption timing helpers."""
+
+import os
+
+import pytest
+
+from src.pipeline import captions
+
+
+@pytest.fixture
+def silence_calls(monkeypatch):
+    """Replace the ffmpeg scan with a counter returning fixed events."""
+    calls = []
+
+    def fake_silence_segments(path, *, noise_db, min_silence):
+        calls.append((path.name, noise_db, min_silence))
+        return [("start", 0.0), ("end", 0.4)]
+
+    monkeypatch.setattr(captions, "_silence_segments", fake_silence_segments)
+    return calls
+
+
+class TestCachedSilenceSegments:
+    def test_unchanged_wav_reuses_cached_events(self, tmp_path, silence_calls):
+        wav = tmp_path / "voice.wav"
+        wav.write_bytes(b"RIFF")
+        cache_dir = tmp_path / ".cache" / "silence"
+
+        first = captions._cached_silence_segments(wav, cache_dir)
+        second = captions._cached_silence_segments(wav, cache_dir)
+
+        assert first == second == [("start", 0.0), ("end", 0.4)]
+        assert len(silence_calls) == 1
+
+    def test_rewritten_wav_invalidates_entry(self, tmp_path, silence_calls):
+        wav = tmp_path / "voice.wav"
+        wav.write_bytes(b"RIFF")
+        cache_dir = tmp_path / ".cache" / "silence"
+        captions._cached_silence_segments(wav, cache_dir)
+
+        wav.write_bytes(b"RIFF-new")
+        stat = wav.stat()
+        os.utime(wav, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        captions._cached_silence_segments(wav, cache_dir)
+
+        assert len(silence_calls) == 2
+
+    def test_detection_parameters_are_part_of_key(self, tmp_path, silence_calls):
+        wav = tmp_path / "voice.wav"
+        wav.write_bytes(b"RIFF")
+        cache_dir = tmp_path / ".cache" / "silence"
+
+        captions._cached_silence_segments(wav, cache_dir)
+        captions._cached_silence_segments(wav, cache_dir, noise_db=-40.0)
+        captions._cached_silence_segments(wav, cache_dir, noise_db=-40.0, min_silence=0.5)
+
+        assert len(silence_calls) == 3
+
+    def test_corrupt_entry_is_recomputed(self, tmp_path, silence_calls):
+        wav = tmp_path / "voice.wav"
+        wav.write_bytes(b"RIFF")
+        cache_dir = tmp_path / ".cache" / "silence"
+        cache_dir.mkdir(parents=True)
+        (cache_dir / "voice.wav.json").write_text("{not json", encoding="utf-8")
+
+        assert captions._cached_silence_segments(wav, cache_dir) == [("start", 0.0), ("end", 0.4)]
+        assert len(silence_calls) == 1
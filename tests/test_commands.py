@@ -0,0 +1,123 @@
+"""Tests for CLI helpers."""
+
+import io
+import threading
+
+import pytest
+
+from src.commands import (
+    CURRENT_REEL_ENV,
+    PIPELINE_STAGES,
+    STAGE_DEPS,
+    _count_status_records,
+    _current_reel_path,
+    _iter_nul_records,
+    _run_stage_graph,
+    _set_current_reel,
+)
+
+
+def _recording_runners(events: list, fail: str = None) -> dict:
+    lock = threading.Lock()
+
+    def make(name):
+        def runner():
+            with lock:
+                events.append(("start", name))
+            if name == fail:
+                raise RuntimeError(f"{name} failed")
+            with lock:
+                events.append(("end", name))
+        return runner
+
+    return {name: make(name) for name in PIPELINE_STAGES}
+
+
+class TestRunStageGraph:
+    def test_starts_stages_after_their_dependencies(self):
+        events = []
+        _run_stage_graph(_recording_runners(events), list(PIPELINE_STAGES), jobs=4)
+
+        assert sorted(name for kind, name in events if kind == "end") == sorted(PIPELINE_STAGES)
+        for name in PIPELINE_STAGES:
+            started = events.index(("start", name))
+            for dep in STAGE_DEPS[name]:
+                assert events.index(("end", dep)) < started
+
+    def test_dependencies_outside_selection_are_satisfied(self):
+        events = []
+        _run_stage_graph(_recording_runners(events), ["captions", "charts"], jobs=2)
+
+        assert {name for _, name in events} == {"captions", "charts"}
+
+    def test_first_failure_is_reraised_and_dependents_never_start(self):
+        events = []
+        with pytest.raises(RuntimeError, match="plan failed"):
+            _run_stage_graph(
+                _recording_runners(events, fail="plan"), list(PIPELINE_STAGES), jobs=4
+            )
+
+        started = {name for kind, name in events if kind == "start"}
+        assert started == {"init", "plan"}
+
+
+# `git status -z --porcelain=v1` output: a rename (with its source path as a
+# separate record), a modification, and two untracked files.
+STATUS_Z = b"R  new name.txt\x00old name.txt\x00 M src/a.py\x00?? b.txt\x00?? dir/c.txt\x00"
+
+
+class TestStatusRecords:
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 64 * 1024])
+    def test_records_split_across_chunk_boundaries(self, chunk_size):
+        records = list(_iter_nul_records(io.BytesIO(STATUS_Z), chunk_size=chunk_size))
+
+        assert records == [
+            b"R  new name.txt",
+            b"old name.txt",
+            b" M src/a.py",
+            b"?? b.txt",
+            b"?? dir/c.txt",
+        ]
+
+    def test_unterminated_last_record_is_kept(self):
+        assert list(_iter_nul_records(io.BytesIO(b"?? a\x00?? b"), chunk_size=2)) == [
+            b"?? a",
+            b"?? b",
+        ]
+
+    @pytest.mark.parametrize("chunk_size", [1, 5, 64 * 1024])
+    def test_rename_and_copy_sources_are_not_counted(self, chunk_size):
+        data = STATUS_Z + b"C  copy.txt\x00orig.txt\x00"
+        records = _iter_nul_records(io.BytesIO(data), chunk_size=chunk_size)
+
+        assert _count_status_records(records) == (2, 3)
+
+
+class TestCurrentReel:
+    def test_setting_another_reel_warns_while_env_override_is_active(
+        self, tmp_path, monkeypatch, capsys
+    ):
+        pinned = tmp_path / "pinned"
+        other = tmp_path / "other"
+        pinned.mkdir()
+        other.mkdir()
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv(CURRENT_REEL_ENV, str(pinned))
+
+        _set_current_reel(other)
+
+        assert CURRENT_REEL_ENV in capsys.readouterr().err
+        assert _current_reel_path() == pinned
+
+    def test_no_warning_when_env_matches_or_is_unset(self, tmp_path, monkeypatch, capsys):
+        reel = tmp_path / "reel"
+        reel.mkdir()
+        monkeypatch.chdir(tmp_path)
+
+        monkeypatch.setenv(CURRENT_REEL_ENV, str(reel))
+        _set_current_reel(reel)
+        monkeypatch.delenv(CURRENT_REEL_ENV)
+        _set_current_reel(reel)
+
+        assert capsys.readouterr().err == ""
+        assert _current_reel_path() == reel.resolve()
@@ -1,6 +1,7 @@
 """Tests for domain models."""
 
 import json
+import os
 import tempfile
 from pathlib import Path
 
@@ -102,6 +103,38 @@ Dark and moody
             assert obj.core_insight == "Test insight"
             assert "inputs/data/test.csv" in obj.data_sources
 
+    def test_from_reel_folder_picks_up_yaml_edits(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            reel_path = Path(tmpdir)
+            (reel_path / "inputs").mkdir(parents=True, exist_ok=True)
+            yaml_file = reel_path / "inputs" / "reel.yaml"
+
+            yaml_file.write_text('title: "First"\n')
+            assert Objective.from_reel_folder(reel_path).title == "First"
+
+            yaml_file.write_text('title: "Second"\n')
+            stat = yaml_file.stat()
+            os.utime(yaml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            assert Objective.from_reel_folder(reel_path).title == "Second"
+
+    def test_from_reel_folder_picks_up_seed_edits(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            reel_path = Path(tmpdir)
+            (reel_path / "inputs").mkdir(parents=True, exist_ok=True)
+            (reel_path / "inputs" / "reel.yaml").write_text('title: "Test"\n')
+            seed_file = reel_path / "inputs" / "seed.md"
+
+            seed_file.write_text("# Hook\nFirst\n")
+            obj = Objective.from_reel_folder(reel_path)
+            assert obj.hook == "First"
+            obj.data_sources.append("local only")
+            assert Objective.from_reel_folder(reel_path).data_sources == []
+
+            seed_file.write_text("# Hook\nSecond\n")
+            stat = seed_file.stat()
+            os.utime(seed_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            assert Objective.from_reel_folder(reel_path).hook == "Second"
+
     def test_duration_seconds(self):
         obj = Objective(
             title="Test",
@@ -0,0 +1,51 @@
+"""Tests for the on-disk fetch cache helpers."""
+
+import os
+import time
+
+import pytest
+
+from src.utils.fetch_cache import open_atomic, read_fresh, write_atomic
+
+
+class TestReadFresh:
+    def test_returns_bytes_within_ttl(self, tmp_path):
+        entry = tmp_path / "index.json"
+        write_atomic(entry, b"cached")
+
+        assert read_fresh(entry, 60) == b"cached"
+
+    def test_stale_entry_is_a_miss(self, tmp_path):
+        entry = tmp_path / "index.json"
+        write_atomic(entry, b"cached")
+        old = time.time() - 120
+        os.utime(entry, (old, old))
+
+        assert read_fresh(entry, 60) is None
+
+    def test_missing_or_uncacheable_is_a_miss(self, tmp_path):
+        assert read_fresh(tmp_path / "missing.json", 60) is None
+        assert read_fresh(None, 60) is None
+
+
+class TestOpenAtomic:
+    def test_replaces_target_only_when_complete(self, tmp_path):
+        entry = tmp_path / "sub" / "index.json"
+        with open_atomic(entry) as f:
+            f.write(b"new")
+            assert not entry.exists()
+
+        assert entry.read_bytes() == b"new"
+        assert list(entry.parent.iterdir()) == [entry]
+
+    def test_exception_removes_part_file_and_keeps_old_entry(self, tmp_path):
+        entry = tmp_path / "index.json"
+        write_atomic(entry, b"old")
+
+        with pytest.raises(RuntimeError):
+            with open_atomic(entry) as f:
+                f.write(b"partial")
+                raise RuntimeError("download failed")
+
+        assert entry.read_bytes() == b"old"
+        assert list(tmp_path.iterdir()) == [entry]